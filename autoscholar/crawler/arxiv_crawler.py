@@ -1,27 +1,133 @@
+import os
+import re
 import json
 import arxiv
+import time
+import hashlib
 import datetime
 import requests
+import threading
 import subprocess
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
-from camel.models import ModelFactory
-from camel.types import ModelPlatformType, ModelType
-from camel.agents import ChatAgent
-
 from autoscholar.crawler.base_crawler import BaseCrawler
+from autoscholar.utils import fast_json
+from autoscholar.utils.cache import JsonCache
+from autoscholar.utils.http import create_session
+from autoscholar.utils.jsonl import JsonlWriter, load_records
 from autoscholar.utils.logger import setup_logger
+from autoscholar.utils.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from camel.agents import ChatAgent
 
 # ArXiv-specific constants
 ARXIV_URL = "http://arxiv.org/"
 BASE_URL = "https://arxiv.paperswithcode.com/api/v0/papers/"
 
+# arXiv API paging: largest page the API serves, seconds between requests
+# (the rate the API terms of use ask for) and retries on failed pages
+ARXIV_MAX_PAGE_SIZE = 2000
+ARXIV_DELAY_SECONDS = 3.0
+ARXIV_NUM_RETRIES = 5
+
+# Collapses newlines and runs of whitespace in abstracts and comments
+_WS_RE = re.compile(r"\s+")
+# Punctuation ignored when comparing titles
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+# PDF downloads are streamed to disk in chunks of this size (bytes)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Bytes of paper markdown sent to the LLM; the rest is rarely needed to
+# classify a paper and only inflates the prompt
+CONTENT_HEAD_BYTES = 32 * 1024
+# Seconds to wait for the server before giving up on a request
+REQUEST_TIMEOUT = 30
+
+# Code URLs rarely change, so re-check them at most once a month
+CODE_URL_CACHE_TTL = 30 * 24 * 60 * 60
+# arXiv announces new papers once a day, so search results are reused
+# for up to a day
+SEARCH_CACHE_TTL = 24 * 60 * 60
+
 # Set up logger
 logger = setup_logger(__name__)
 
 
+def _strip_version(paper_id: str) -> str:
+    """Remove the version suffix from an arXiv ID.
+
+    Only a trailing "v<digits>" is removed, so old-style IDs whose archive
+    name contains a "v" (e.g. "solv-int/9901001") keep their full prefix.
+    """
+    key, sep, version = paper_id.rpartition("v")
+    return key if sep and version.isdigit() else paper_id
+
+
+def _normalize_title(title: str) -> str:
+    """Normalize a title so that trivially different copies compare equal."""
+    return _WS_RE.sub(" ", _PUNCT_RE.sub("", title)).strip().lower()
+
+
+def _dedup_key(result: arxiv.Result) -> str:
+    """Return the key identifying a paper across topics and runs.
+
+    This is the arXiv ID without its version. The normalized title is only
+    used for results that carry no ID.
+    """
+    paper_id = result.get_short_id()
+    if paper_id:
+        return _strip_version(paper_id)
+    return "title:" + _normalize_title(result.title)
+
+
+def _result_to_dict(result: arxiv.Result) -> Dict[str, Any]:
+    """Serialize the fields of an arXiv result used by the crawler."""
+    return {
+        "entry_id": result.entry_id,
+        "updated": result.updated.isoformat(),
+        "published": result.published.isoformat(),
+        "title": result.title,
+        "authors": [author.name for author in result.authors],
+        "summary": result.summary,
+        "comment": result.comment,
+        "primary_category": result.primary_category,
+        "links": [
+            [link.href, link.title, link.rel, link.content_type]
+            for link in result.links
+        ],
+    }
+
+
+def _result_from_dict(data: Dict[str, Any]) -> arxiv.Result:
+    """Rebuild an arXiv result serialized by ``_result_to_dict``."""
+    return arxiv.Result(
+        entry_id=data["entry_id"],
+        updated=datetime.datetime.fromisoformat(data["updated"]),
+        published=datetime.datetime.fromisoformat(data["published"]),
+        title=data["title"],
+        authors=[arxiv.Result.Author(name) for name in data["authors"]],
+        summary=data["summary"],
+        comment=data["comment"],
+        primary_category=data["primary_category"],
+        links=[arxiv.Result.Link(*link) for link in data["links"]],
+    )
+
+
+def _default_classification() -> Dict[str, Any]:
+    """Return the classification used when the LLM result is unavailable."""
+    return {
+        "trading_frequency": "unknown",
+        "market_type": "unknown",
+        "models_used": [],
+        "data_types": [],
+        "trading_strategies": [],
+    }
+
+
 @dataclass
 class ArxivCrawlerConfig:
     """Configuration class for ArxivCrawler.
@@ -34,6 +140,27 @@ class ArxivCrawlerConfig:
         Maximum number of papers to fetch per query
     download_pdf : bool
         Whether to download PDF files
+    max_workers : int
+        Maximum number of concurrent code URL lookups and PDF downloads,
+        shared by all topics
+    topic_workers : int
+        Maximum number of topics processed concurrently; their arXiv
+        searches still run one at a time
+    conversion_workers : int
+        Maximum number of concurrent marker_single PDF conversions
+    rate_limit_calls : int
+        Maximum number of PDF downloads from arXiv per rate limit period
+    rate_limit_period : float
+        Length of the rate limit period in seconds
+    classify : bool
+        Whether to classify papers with an LLM
+    classify_batch_size : int
+        Number of papers classified together in a single LLM request
+    content_head_bytes : int
+        Maximum number of bytes of each paper's markdown included in the
+        classification prompt
+    compress : bool
+        Whether to gzip the results file
     keywords : Dict[str, Any]
         Dictionary of search keywords and filters
     """
@@ -41,6 +168,15 @@ class ArxivCrawlerConfig:
     output_dir: str = "data"
     max_results: int = 10
     download_pdf: bool = False
+    max_workers: int = 8
+    topic_workers: int = 4
+    conversion_workers: int = 2
+    rate_limit_calls: int = 3
+    rate_limit_period: float = 1.0
+    classify: bool = False
+    classify_batch_size: int = 5
+    content_head_bytes: int = CONTENT_HEAD_BYTES
+    compress: bool = False
     keywords: Dict[str, Any] = None
 
     @classmethod
@@ -61,6 +197,17 @@ class ArxivCrawlerConfig:
             output_dir=config_dict.get("output_dir", "data"),
             max_results=config_dict.get("max_results", 10),
             download_pdf=config_dict.get("download_pdf", False),
+            max_workers=config_dict.get("max_workers", 8),
+            topic_workers=config_dict.get("topic_workers", 4),
+            conversion_workers=config_dict.get("conversion_workers", 2),
+            rate_limit_calls=config_dict.get("rate_limit_calls", 3),
+            rate_limit_period=config_dict.get("rate_limit_period", 1.0),
+            classify=config_dict.get("classify", False),
+            classify_batch_size=config_dict.get("classify_batch_size", 5),
+            content_head_bytes=config_dict.get(
+                "content_head_bytes", CONTENT_HEAD_BYTES
+            ),
+            compress=config_dict.get("compress", False),
             keywords=config_dict.get("keywords", {}),
         )
 
@@ -82,33 +229,51 @@ class ArxivCrawler(BaseCrawler):
         """
         super().__init__(**kwargs)
         self.config = ArxivCrawlerConfig.from_dict(kwargs)
-        self.all_results = {}
-
-    def get_authors(
-        self, authors: List[str], partial_author: bool = False
-    ) -> str:
-        """Retrieve a formatted string of authors.
-
-        Parameters:
-        ----------
-        authors : List[str]
-            List of author names.
-        partial_author : bool, optional
-            If True, return only the first three authors.
-
-        Returns:
-        -------
-        str
-            String of author names.
-        """
-        if not partial_author:
-            return ", ".join(str(author) for author in authors)
-        else:
-            return ", ".join(str(author) for author in authors[:3])
+        # Keys of papers written this run; the papers themselves are streamed
+        # to the results file and not kept in memory
+        self.all_results: Set[str] = set()
+        self._writer: Optional[JsonlWriter] = None
+        self._results_lock = threading.Lock()
+        # Keys of papers saved by previous runs or already claimed by a
+        # topic in this run
+        self._known_keys: Set[str] = set()
+        self._folder_cache: Dict[Tuple[str, str], Path] = {}
+        self._code_url_cache = JsonCache(
+            Path(self.config.output_dir) / ".code_url_cache.json",
+            ttl=CODE_URL_CACHE_TTL,
+        )
+        self._search_cache = JsonCache(
+            Path(self.config.output_dir) / ".search_cache.json",
+            ttl=SEARCH_CACHE_TTL,
+        )
+        self._classification_cache = JsonCache(
+            Path(self.config.output_dir) / ".classification_cache.json"
+        )
+        self._chat_agent = None
+        # Shared by all worker threads so connections are reused
+        self._session = create_session()
+        # arXiv clients keyed by page size, shared across topics so their
+        # sessions and request pacing are reused
+        self._arxiv_clients: Dict[int, arxiv.Client] = {}
+        self._arxiv_clients_lock = threading.Lock()
+        # Each client only paces its own requests, so searches from
+        # concurrent topics are serialized and spaced out here
+        self._search_lock = threading.Lock()
+        self._last_search_end = 0.0
+        # Per-paper network work of all topics shares one pool, created by
+        # ``run``
+        self._paper_executor: Optional[ThreadPoolExecutor] = None
+        # Keep concurrent downloads within arXiv's request rate guidelines
+        self._arxiv_limiter = RateLimiter(
+            self.config.rate_limit_calls, self.config.rate_limit_period
+        )
 
     def _get_pdf_folder(self, topic: str, date: datetime.date) -> Path:
         """Get the folder path for storing PDFs based on topic and date.
 
+        Folders are created once and remembered, so repeated calls for the
+        same topic and month do not touch the filesystem.
+
         Parameters:
         ----------
         topic : str
@@ -122,19 +287,20 @@ class ArxivCrawler(BaseCrawler):
             Path to the PDF folder
         """
         # Create folder structure: output_dir/arxiv/topic/YYYY-MM
-        folder_path = (
-            Path(self.config.output_dir)
-            / "arxiv"
-            / topic
-            / date.strftime("%Y-%m")
-        )
-        folder_path.mkdir(parents=True, exist_ok=True)
+        cache_key = (topic, date.strftime("%Y-%m"))
+        folder_path = self._folder_cache.get(cache_key)
+        if folder_path is None:
+            folder_path = (
+                Path(self.config.output_dir) / "arxiv" / topic / cache_key[1]
+            )
+            folder_path.mkdir(parents=True, exist_ok=True)
+            self._folder_cache[cache_key] = folder_path
         return folder_path
 
     def _download_pdf(
         self, result: arxiv.Result, paper_key: str, topic: str
-    ) -> None:
-        """Download PDF for a paper and convert it to Markdown.
+    ) -> Optional[Path]:
+        """Download PDF for a paper.
 
         Parameters:
         ----------
@@ -144,6 +310,12 @@ class ArxivCrawler(BaseCrawler):
             Paper key (ID without version)
         topic : str
             Topic name for categorization
+
+        Returns:
+        -------
+        Optional[Path]
+            Path to the PDF if it still needs to be converted to Markdown,
+            None if it is already converted or the download failed
         """
         try:
             # Get the appropriate folder based on topic and date
@@ -151,27 +323,85 @@ class ArxivCrawler(BaseCrawler):
             pdf_path = pdf_folder / f"{paper_key}.pdf"
             markdown_path = pdf_folder / f"{paper_key}.md"
 
-            # Download PDF
-            pdf_response = requests.get(result.pdf_url)
-            with open(pdf_path, "wb") as f:
-                f.write(pdf_response.content)
-            logger.info(f"Downloaded PDF for {paper_key} to {pdf_path}")
+            # Skip papers converted by a previous run, even if their PDF
+            # was removed since
+            if markdown_path.exists():
+                logger.debug("Markdown already exists for %s", paper_key)
+                return None
+            if pdf_path.exists():
+                return pdf_path
+
+            # Stream the PDF to a temporary file instead of buffering it in
+            # memory, and only move it into place once it is complete so an
+            # interrupted download is retried by the next run
+            part_path = pdf_path.with_name(pdf_path.name + ".part")
+            self._arxiv_limiter.acquire()
+            try:
+                with self._session.get(
+                    result.pdf_url, stream=True, timeout=REQUEST_TIMEOUT
+                ) as pdf_response:
+                    pdf_response.raise_for_status()
+                    with open(part_path, "wb") as f:
+                        for chunk in pdf_response.iter_content(
+                            DOWNLOAD_CHUNK_SIZE
+                        ):
+                            f.write(chunk)
+                os.replace(part_path, pdf_path)
+            except BaseException:
+                part_path.unlink(missing_ok=True)
+                raise
+            logger.info("Downloaded PDF for %s to %s", paper_key, pdf_path)
+            return pdf_path
+
+        except (requests.exceptions.RequestException, OSError) as e:
+            # A failed download or write only skips this paper
+            logger.error("Error downloading PDF for %s: %s", paper_key, e)
+            return None
+
+    def _convert_pdf(self, pdf_path: Path) -> None:
+        """Convert a downloaded PDF to Markdown with marker_single.
 
-            # Convert PDF to Markdown
-            conversion_command = ["marker_single", str(pdf_path)]
-            conversion_command.extend(["--output_dir", str(pdf_folder)])
+        Parameters:
+        ----------
+        pdf_path : Path
+            Path to the PDF file
+        """
+        conversion_command = ["marker_single", str(pdf_path)]
+        conversion_command.extend(["--output_dir", str(pdf_path.parent)])
 
+        try:
             subprocess.run(conversion_command, check=True)
-            logger.info(f"Converted PDF to Markdown for {paper_key}")
+            logger.info("Converted PDF to Markdown for %s", pdf_path.stem)
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.error(
+                "Error converting PDF to Markdown for %s: %s", pdf_path.stem, e
+            )
+
+    def _convert_batch(self, pdf_paths: List[Path]) -> None:
+        """Convert a batch of downloaded PDFs to Markdown concurrently.
+
+        Each conversion runs in its own marker_single process, so threads
+        are enough to keep several conversions in flight.
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error downloading PDF for {paper_key}: {e}")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Error converting PDF to Markdown for {paper_key}: {e}")
+        Parameters:
+        ----------
+        pdf_paths : List[Path]
+            Paths to the PDF files
+        """
+        if not pdf_paths:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.config.conversion_workers)
+        ) as executor:
+            list(executor.map(self._convert_pdf, pdf_paths))
 
     def _get_code_url(self, paper_id: str) -> Optional[str]:
         """Get code repository URL for a paper.
 
+        Successful lookups (including papers without code) are cached on
+        disk, keyed by paper ID.
+
         Parameters:
         ----------
         paper_id : str
@@ -182,18 +412,75 @@ class ArxivCrawler(BaseCrawler):
         Optional[str]
             Code repository URL if found, None otherwise
         """
+        if paper_id in self._code_url_cache:
+            return self._code_url_cache.get(paper_id)
+
         try:
-            response = requests.get(f"{BASE_URL}{paper_id}").json()
+            response = self._session.get(
+                f"{BASE_URL}{paper_id}", timeout=REQUEST_TIMEOUT
+            ).json()
+            code_url = None
             if "official" in response and response["official"]:
-                return response["official"]["url"]
+                code_url = response["official"]["url"]
+            self._code_url_cache.set(paper_id, code_url)
+            return code_url
         except (
             requests.exceptions.RequestException,
             json.JSONDecodeError,
         ) as e:
-            logger.error(f"Error getting code URL for {paper_id}: {e}")
+            logger.error("Error getting code URL for %s: %s", paper_id, e)
         return None
 
-    def _classify_paper(self, title: str, abstract: str, markdown_content: str = "") -> Dict[str, Any]:
+    def _get_chat_agent(self) -> "ChatAgent":
+        """Get the chat agent used for classification, creating it once.
+
+        camel is imported here rather than at module level so crawling
+        without classification does not pay for loading it.
+
+        Returns:
+        -------
+        ChatAgent
+            Chat agent backed by the classification model
+        """
+        if self._chat_agent is None:
+            from camel.agents import ChatAgent
+            from camel.models import ModelFactory
+            from camel.types import ModelPlatformType, ModelType
+
+            model_instance = ModelFactory.create(
+                model_platform=ModelPlatformType.OPENAI,
+                model_type=ModelType.GPT_4O,
+                model_config_dict={"temperature": 0.0},
+            )
+            self._chat_agent = ChatAgent(model=model_instance)
+        return self._chat_agent
+
+    @staticmethod
+    def _classification_key(
+        title: str, abstract: str, markdown_content: str = ""
+    ) -> str:
+        """Build the cache key of a classification request.
+
+        Parameters:
+        ----------
+        title : str
+            Paper title
+        abstract : str
+            Paper abstract
+        markdown_content : str, optional
+            Paper content in markdown format
+
+        Returns:
+        -------
+        str
+            SHA-1 hex digest of the classified content
+        """
+        content = "\0".join((title, abstract, markdown_content))
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    def _classify_paper(
+        self, title: str, abstract: str, markdown_content: str = ""
+    ) -> Dict[str, Any]:
         """Classify a paper using LLM to extract detailed information.
 
         Parameters:
@@ -210,80 +497,193 @@ class ArxivCrawler(BaseCrawler):
         Dict[str, Any]
             Dictionary containing classification information
         """
-        try:
-            model_instance = ModelFactory.create(
-                model_platform=ModelPlatformType.OPENAI,
-                model_type=ModelType.GPT_4O,
-                model_config_dict={"temperature": 0.0},
+        return self._classify_papers_batch(
+            [(title, abstract, markdown_content)]
+        )[0]
+
+    def _classify_papers_batch(
+        self, items: List[Tuple[str, str, str]]
+    ) -> List[Dict[str, Any]]:
+        """Classify several papers, reusing cached classifications.
+
+        Papers missing from the classification cache are sent to the LLM
+        ``classify_batch_size`` at a time, one request per batch.
+
+        Parameters:
+        ----------
+        items : List[Tuple[str, str, str]]
+            (title, abstract, markdown_content) of each paper
+
+        Returns:
+        -------
+        List[Dict[str, Any]]
+            Classification of each paper, in the order of ``items``
+        """
+        keys = [self._classification_key(*item) for item in items]
+        classifications = [self._classification_cache.get(key) for key in keys]
+        pending = [i for i, cached in enumerate(classifications) if not cached]
+
+        batch_size = max(1, self.config.classify_batch_size)
+        for start in range(0, len(pending), batch_size):
+            indices = pending[start : start + batch_size]
+            results = self._request_classifications(
+                [items[i] for i in indices]
             )
-            chat_agent = ChatAgent(model=model_instance)
+            for i, classification in zip(indices, results):
+                if classification is None:
+                    classification = _default_classification()
+                else:
+                    self._classification_cache.set(keys[i], classification)
+                classifications[i] = classification
+
+        return classifications
+
+    def _request_classifications(
+        self, items: List[Tuple[str, str, str]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Classify a batch of papers with a single LLM request.
+
+        Parameters:
+        ----------
+        items : List[Tuple[str, str, str]]
+            (title, abstract, markdown_content) of each paper
 
-            prompt = f"""Analyze this academic paper and provide a detailed classification in JSON format:
+        Returns:
+        -------
+        List[Optional[Dict[str, Any]]]
+            Classification of each paper, None if it could not be obtained
+        """
+        papers = "\n\n".join(
+            f"Paper {index}:\n"
+            f"Title: {title}\n"
+            f"Abstract: {abstract}"
+            + (f"\nPaper Content: {markdown_content}" if markdown_content else "")
+            for index, (title, abstract, markdown_content) in enumerate(items)
+        )
+        prompt = f"""Analyze the following academic papers and provide a detailed classification of each paper in JSON format:
 
-Title: {title}
-Abstract: {abstract}
-{f'Paper Content: {markdown_content}' if markdown_content else ''}
+{papers}
 
-Please classify the paper based on the following aspects:
+Please classify each paper based on the following aspects:
 1. Trading Frequency: high_frequency, medium_frequency, or low_frequency
 2. Market Type: stock_market, crypto_market, forex_market, commodity_market, or other
 3. Models Used: list of specific models mentioned (e.g., LSTM, BERT, GPT, etc.)
 4. Data Types: list of data types used (e.g., price_data, news_data, sentiment_data, etc.)
 5. Trading Strategy: list of trading strategies mentioned (e.g., trend_following, mean_reversion, etc.)
 
-Return the classification in this exact JSON format:
+Return a JSON array with one object per paper, in this exact format:
+[
 {{
+"index": 0,
 "trading_frequency": "string",
 "market_type": "string",
 "models_used": ["string"],
 "data_types": ["string"],
 "trading_strategies": ["string"]
-}}"""
+}}
+]"""
+
+        classifications: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        titles = ", ".join(f"'{title}'" for title, _, _ in items)
+        try:
+            # The agent is shared across batches, so drop previous turns
+            chat_agent = self._get_chat_agent()
+            chat_agent.reset()
 
             # Get classification from LLM
             response = chat_agent.step(prompt)
             response_content = response.msgs[0].content.strip()
-            
+
             # Log the raw response for debugging
-            logger.debug(f"Raw LLM response for paper '{title}': {response_content}")
-            
+            logger.debug(
+                "Raw LLM response for papers %s: %s", titles, response_content
+            )
+
             try:
-                classification = json.loads(response_content)
+                parsed = json.loads(response_content)
             except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse LLM response as JSON for paper '{title}': {e}")
-                logger.error(f"Raw response content: {response_content}")
-                # Return default classification if JSON parsing fails
-                return {
-                    "trading_frequency": "unknown",
-                    "market_type": "unknown",
-                    "models_used": [],
-                    "data_types": [],
-                    "trading_strategies": []
-                }
-                
-            return classification
+                logger.error(
+                    "Failed to parse LLM response as JSON for papers %s: %s",
+                    titles,
+                    e,
+                )
+                logger.error("Raw response content: %s", response_content)
+                return classifications
+
+        except Exception as e:
+            logger.error("Error classifying papers %s: %s", titles, e)
+            return classifications
+
+        if isinstance(parsed, dict):
+            parsed = [parsed]
+        for entry in parsed:
+            if not isinstance(entry, dict):
+                continue
+            index = entry.pop("index", 0 if len(items) == 1 else None)
+            if isinstance(index, int) and 0 <= index < len(items):
+                classifications[index] = entry
+
+        return classifications
+
+    def _read_markdown(
+        self, result: arxiv.Result, paper_key: str, topic: str
+    ) -> str:
+        """Read the markdown converted from a paper's PDF.
+
+        Only the first ``content_head_bytes`` bytes are read, since that is
+        all the classification prompt uses.
+
+        Parameters:
+        ----------
+        result : arxiv.Result
+            Paper result from arXiv API
+        paper_key : str
+            Paper key (ID without version)
+        topic : str
+            Topic name for categorization
 
+        Returns:
+        -------
+        str
+            Markdown content, or an empty string if it is not available
+        """
+        try:
+            markdown_path = (
+                self._get_pdf_folder(topic, result.published.date())
+                / f"{paper_key}.md"
+            )
+            if markdown_path.exists():
+                with open(markdown_path, "rb") as f:
+                    head = f.read(self.config.content_head_bytes)
+                return head.decode("utf-8", errors="ignore")
         except Exception as e:
-            logger.error(f"Error classifying paper '{title}': {e}")
-            return {
-                "trading_frequency": "unknown",
-                "market_type": "unknown",
-                "models_used": [],
-                "data_types": [],
-                "trading_strategies": []
-            }
+            logger.error(
+                "Error reading markdown file for %s: %s", paper_key, e
+            )
+        return ""
 
     def _process_paper(
-        self, result: arxiv.Result, topic: str
+        self,
+        result: arxiv.Result,
+        topic: str,
+        repo_url: Optional[str] = None,
+        classification: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Process a single paper result.
 
+        Network lookups, PDF downloads and LLM classification are done in
+        batches by ``_fetch_papers`` and passed in.
+
         Parameters:
         ----------
         result : arxiv.Result
             Paper result from arXiv API
         topic : str
             Topic name for categorization
+        repo_url : Optional[str]
+            Code repository URL resolved for the paper
+        classification : Optional[Dict[str, Any]]
+            LLM classification of the paper
 
         Returns:
         -------
@@ -291,97 +691,223 @@ Return the classification in this exact JSON format:
             Processed paper data
         """
         paper_id = result.get_short_id()
-        paper_key = paper_id.split("v")[0]  # Remove version number
+        paper_key = _strip_version(paper_id)
         paper_url = f"{ARXIV_URL}abs/{paper_key}"
-
-        # Get code repository URL if available
-        repo_url = self._get_code_url(paper_id)
-
-        # Download PDF and convert to markdown if enabled
-        markdown_content = ""
-        if self.config.download_pdf:
-            self._download_pdf(result, paper_key, topic)
-            # Read the converted markdown file
-            try:
-                markdown_path = self._get_pdf_folder(topic, result.published.date()) / f"{paper_key}.md"
-                if markdown_path.exists():
-                    with open(markdown_path, 'r', encoding='utf-8') as f:
-                        markdown_content = f.read()
-            except Exception as e:
-                logger.error(f"Error reading markdown file for {paper_key}: {e}")
-            
-        # Get detailed classification using LLM
-        classification = self._classify_paper(result.title, result.summary, markdown_content)
-        print(f"Classification: {classification}")
+        author_names = [str(author) for author in result.authors]
 
         return {
             "topic": topic,
             "title": result.title,
-            "authors": self.get_authors(result.authors),
-            "first_author": self.get_authors(
-                result.authors, partial_author=True
-            ),
-            "abstract": result.summary.replace("\n", " "),
+            "authors": ", ".join(author_names),
+            "first_author": ", ".join(author_names[:3]),
+            "abstract": _WS_RE.sub(" ", result.summary).strip(),
             "url": paper_url,
             "code_url": repo_url,
             "category": result.primary_category,
             "publish_time": str(result.published.date()),
             "update_time": str(result.updated.date()),
-            "comments": result.comment.replace("\n", " ")
+            "comments": _WS_RE.sub(" ", result.comment).strip()
             if result.comment
             else "",
             "classification": classification,
         }
 
-    def _fetch_papers(self, topic: str, query: str, max_results: int) -> None:
-        """Fetch papers for a specific topic.
+    def _get_arxiv_client(self, max_results: int) -> arxiv.Client:
+        """Get a client whose pages cover ``max_results`` in one request.
+
+        The client always requests full pages, so the page size follows the
+        number of results wanted, up to the largest page arXiv serves.
+
+        Parameters:
+        ----------
+        max_results : int
+            Maximum number of papers to fetch
+
+        Returns:
+        -------
+        arxiv.Client
+            Client shared by all searches with the same page size
+        """
+        page_size = max(1, min(max_results, ARXIV_MAX_PAGE_SIZE))
+        with self._arxiv_clients_lock:
+            client = self._arxiv_clients.get(page_size)
+            if client is None:
+                client = arxiv.Client(
+                    page_size=page_size,
+                    delay_seconds=ARXIV_DELAY_SECONDS,
+                    num_retries=ARXIV_NUM_RETRIES,
+                )
+                self._arxiv_clients[page_size] = client
+        return client
+
+    def _search(self, query: str, max_results: int) -> List[arxiv.Result]:
+        """Search arXiv, reusing results cached earlier the same day.
 
         Parameters:
         ----------
-        topic : str
-            Topic name for categorization
         query : str
             Search query string
         max_results : int
             Maximum number of papers to fetch
+
+        Returns:
+        -------
+        List[arxiv.Result]
+            Search results, newest submissions first
         """
+        today = datetime.date.today().isoformat()
+        key = hashlib.sha1(
+            f"{query}|{max_results}|{today}".encode("utf-8")
+        ).hexdigest()
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            logger.info("Using cached search results for query: %s", query)
+            return [_result_from_dict(data) for data in cached]
+
         search = arxiv.Search(
             query=query,
             max_results=max_results,
             sort_by=arxiv.SortCriterion.SubmittedDate,
         )
+        client = self._get_arxiv_client(max_results)
+        with self._search_lock:
+            # arXiv asks for at most one API request every few seconds, so
+            # wait after the last page of the previous search
+            wait = (
+                self._last_search_end + ARXIV_DELAY_SECONDS - time.monotonic()
+            )
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                results = list(client.results(search))
+            finally:
+                self._last_search_end = time.monotonic()
+        self._search_cache.set(
+            key, [_result_to_dict(result) for result in results]
+        )
+        return results
 
-        for result in search.results():
-            paper_key = result.get_short_id().split("v")[0]
-            self.all_results[paper_key] = self._process_paper(result, topic)
-            logger.info(f"Processed paper: {result.title}")
+    def _fetch_papers(self, topic: str, query: str, max_results: int) -> None:
+        """Fetch papers for a specific topic.
 
-    def _save_results(self) -> None:
-        """Save all crawled results to a single JSON file."""
-        if not self.all_results:
-            logger.warning("No results to save")
-            return
+        Parameters:
+        ----------
+        topic : str
+            Topic name for categorization
+        query : str
+            Search query string
+        max_results : int
+            Maximum number of papers to fetch
+        """
+        logger.info("Processing topic: %s, query: %s", topic, query)
+        results = self._search(query, max_results)
+        # Papers saved by previous runs or claimed by another topic need no
+        # lookups, downloads or LLM calls
+        new_results = []
+        with self._results_lock:
+            for result in results:
+                dedup_key = _dedup_key(result)
+                if dedup_key in self._known_keys:
+                    continue
+                self._known_keys.add(dedup_key)
+                new_results.append(result)
+        if len(new_results) < len(results):
+            logger.info(
+                "Skipping %d already saved or claimed papers for topic: %s",
+                len(results) - len(new_results),
+                topic,
+            )
+        results = new_results
+        paper_ids = [result.get_short_id() for result in results]
+        paper_keys = [_strip_version(paper_id) for paper_id in paper_ids]
+
+        # Code URL lookups and PDF downloads are network-bound, so overlap
+        # them across papers instead of waiting on each round-trip in turn
+        executor = self._paper_executor
+        code_url_futures = [
+            executor.submit(self._get_code_url, paper_id)
+            for paper_id in paper_ids
+        ]
+        download_futures = []
+        if self.config.download_pdf:
+            download_futures = [
+                executor.submit(self._download_pdf, result, paper_key, topic)
+                for result, paper_key in zip(results, paper_keys)
+            ]
+        repo_urls = [future.result() for future in code_url_futures]
+        pending_conversions = [
+            pdf_path
+            for pdf_path in (future.result() for future in download_futures)
+            if pdf_path is not None
+        ]
+
+        # Convert after all downloads so marker jobs don't compete with them
+        self._convert_batch(pending_conversions)
+
+        classifications = [None] * len(results)
+        if self.config.classify:
+            markdown_contents = [
+                self._read_markdown(result, paper_key, topic)
+                if self.config.download_pdf
+                else ""
+                for result, paper_key in zip(results, paper_keys)
+            ]
+            classifications = self._classify_papers_batch(
+                [
+                    (result.title, result.summary, markdown_content)
+                    for result, markdown_content in zip(
+                        results, markdown_contents
+                    )
+                ]
+            )
+
+        for result, paper_key, repo_url, classification in zip(
+            results, paper_keys, repo_urls, classifications
+        ):
+            paper = self._process_paper(result, topic, repo_url, classification)
+            with self._results_lock:
+                self.all_results.add(paper_key)
+            self._writer.write(paper_key, paper)
+            logger.info("Processed paper: %s", result.title)
+
+    def _load_known_papers(self) -> Set[str]:
+        """Collect the papers saved by previous runs.
 
+        Returns:
+        -------
+        Set[str]
+            Paper keys found in existing results files
+        """
+        known_keys = set()
         output_dir = Path(self.config.output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        for path in output_dir.glob("arxiv_papers_*.json*"):
+            try:
+                if path.name.endswith((".jsonl", ".jsonl.gz")):
+                    records = load_records(path)
+                else:
+                    records = fast_json.loads(path.read_bytes())
+            except (OSError, ValueError) as e:
+                logger.warning("Could not read saved results %s: %s", path, e)
+                continue
+            known_keys.update(records)
+        return known_keys
 
-        today = datetime.date.today().strftime("%Y-%m-%d")
-        output_path = output_dir / f"arxiv_papers_{today}.json"
+    def _get_output_path(self) -> Path:
+        """Get the path of today's JSON Lines results file.
 
-        # Load existing data if any
-        if output_path.exists():
-            with open(output_path, "r") as f:
-                existing_data = json.load(f)
-        else:
-            existing_data = {}
+        The file is gzip-compressed (".jsonl.gz") when ``compress`` is set.
 
-        # Update with new data
-        existing_data.update(self.all_results)
+        Returns:
+        -------
+        Path
+            Path to the results file
+        """
+        output_dir = Path(self.config.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Write back to file
-        with open(output_path, "w") as f:
-            json.dump(existing_data, f, indent=2)
-        logger.info(f"Saved {len(self.all_results)} papers to {output_path}")
+        today = datetime.date.today().strftime("%Y-%m-%d")
+        suffix = ".jsonl.gz" if self.config.compress else ".jsonl"
+        return output_dir / f"arxiv_papers_{today}{suffix}"
 
     def run(self, **kwargs) -> None:
         """Execute the arXiv crawler workflow."""
@@ -391,6 +917,8 @@ Return the classification in this exact JSON format:
         max_results = self.config.max_results
 
         logger.info("Fetching data begin")
+        self._known_keys = self._load_known_papers()
+        tasks = []
         for topic, keyword_info in keywords.items():
             if isinstance(keyword_info, dict) and "filters" in keyword_info:
                 query = " OR ".join(keyword_info["filters"])
@@ -398,9 +926,38 @@ Return the classification in this exact JSON format:
             else:
                 query = topic
                 topic_max_results = max_results
-
-            logger.info(f"Processing topic: {topic}, query: {query}")
-            self._fetch_papers(topic, query, topic_max_results)
-
-        self._save_results()
+            tasks.append((topic, query, topic_max_results))
+
+        # Papers are appended to today's JSON Lines file as they are
+        # processed; use ``autoscholar.utils.jsonl.load_records`` to read it
+        # back into a dictionary keyed by paper key
+        self._writer = JsonlWriter(self._get_output_path())
+        self._paper_executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.max_workers)
+        )
+        try:
+            # Topics are independent and I/O-bound, so fetch them concurrently
+            with ThreadPoolExecutor(
+                max_workers=max(1, self.config.topic_workers)
+            ) as executor:
+                futures = [
+                    executor.submit(self._fetch_papers, *task) for task in tasks
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            self._paper_executor.shutdown()
+            self._paper_executor = None
+            self._writer.close()
+            if self._writer.count:
+                logger.info(
+                    "Saved %d papers to %s",
+                    self._writer.count,
+                    self._writer.path,
+                )
+            else:
+                logger.warning("No results to save")
+            self._code_url_cache.save()
+            self._search_cache.save()
+            self._classification_cache.save()
         logger.info("Fetching data end")
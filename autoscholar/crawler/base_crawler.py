@@ -1,6 +1,8 @@
+import copy
+import functools
 from pathlib import Path
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 import yaml
 
 from autoscholar.utils.logger import setup_logger
@@ -8,6 +10,21 @@ from autoscholar.utils.logger import setup_logger
 # Set up logger
 logger = setup_logger(__name__)
 
+# Use the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file, caching the result per path, mtime and size.
+
+    The modification time and size are part of the cache key, so an edited
+    file is parsed again. The returned dict is shared between calls and
+    must not be modified.
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
 
 class BaseCrawler(ABC):
     """Base class for implementing crawlers for different sources.
@@ -31,12 +48,17 @@ class BaseCrawler(ABC):
         Path(self.output_dir).mkdir(parents=True, exist_ok=True)
 
     @classmethod
-    def from_config_file(cls, config_path: Path, **kwargs) -> "BaseCrawler":
+    def from_config_file(
+        cls, config_path: Union[str, Path], **kwargs
+    ) -> "BaseCrawler":
         """Create a crawler instance from a configuration file.
 
+        Parsed files are cached until they are modified, so creating
+        crawlers repeatedly from the same file parses it only once.
+
         Parameters:
         ----------
-        config_path : Path
+        config_path : Union[str, Path]
             Path to the configuration file
         **kwargs : Any
             Additional parameters to override config file settings
@@ -46,13 +68,37 @@ class BaseCrawler(ABC):
         BaseCrawler
             Configured crawler instance
         """
+        config_path = Path(config_path)
         if not config_path.exists():
             raise FileNotFoundError(
                 f"Configuration file not found: {config_path}"
             )
 
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        stat = config_path.stat()
+        config = _load_yaml_cached(
+            str(config_path.resolve()), stat.st_mtime_ns, stat.st_size
+        )
+        return cls.from_config_dict(config, **kwargs)
+
+    @classmethod
+    def from_config_dict(
+        cls, config: Dict[str, Any], **kwargs
+    ) -> "BaseCrawler":
+        """Create a crawler instance from a configuration dictionary.
+
+        Parameters:
+        ----------
+        config : Dict[str, Any]
+            Configuration settings; the dictionary is not modified
+        **kwargs : Any
+            Additional parameters to override the configuration settings
+
+        Returns:
+        -------
+        BaseCrawler
+            Configured crawler instance
+        """
+        config = copy.deepcopy(config)
 
         # Update config with any overrides
         config.update(kwargs)
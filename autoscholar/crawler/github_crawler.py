@@ -1,4 +1,3 @@
-import json
 import datetime
 import requests
 from typing import Dict, List, Any, Optional
@@ -6,10 +5,15 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from autoscholar.crawler.base_crawler import BaseCrawler
+from autoscholar.utils import fast_json
+from autoscholar.utils.http import create_session
+from autoscholar.utils.jsonl import append_records
 from autoscholar.utils.logger import setup_logger
 
 # GitHub-specific constants
 GITHUB_API_URL = "https://api.github.com/search/repositories"
+# Seconds to wait for the server before giving up on a request
+REQUEST_TIMEOUT = 30
 
 # Set up logger
 logger = setup_logger(__name__)
@@ -27,6 +31,8 @@ class GithubCrawlerConfig:
         Maximum number of repositories to fetch per query
     github_token : str
         GitHub API token for authentication
+    compress : bool
+        Whether to gzip the results file
     keywords : Dict[str, Any]
         Dictionary of search keywords and filters
     """
@@ -34,6 +40,7 @@ class GithubCrawlerConfig:
     output_dir: str = "data"
     max_results: int = 10
     github_token: str = None
+    compress: bool = False
     keywords: Dict[str, Any] = None
 
     @classmethod
@@ -54,6 +61,7 @@ class GithubCrawlerConfig:
             output_dir=config_dict.get("output_dir", "data"),
             max_results=config_dict.get("max_results", 10),
             github_token=config_dict.get("github_token"),
+            compress=config_dict.get("compress", False),
             keywords=config_dict.get("keywords", {}),
         )
 
@@ -77,10 +85,13 @@ class GithubCrawler(BaseCrawler):
         self.config = GithubCrawlerConfig.from_dict(kwargs)
         self.all_results = {}
 
-        # GitHub API token (optional)
-        self.headers = {}
+        # One session for all queries, with the optional GitHub API token
+        # attached once as a default header
+        self.session = create_session()
         if self.config.github_token:
-            self.headers["Authorization"] = f"token {self.config.github_token}"
+            self.session.headers["Authorization"] = (
+                f"token {self.config.github_token}"
+            )
 
     def run(self, **kwargs) -> None:
         """Execute the GitHub crawler workflow."""
@@ -99,7 +110,7 @@ class GithubCrawler(BaseCrawler):
             logger.info(f"Processing topic: {topic}, query: {query}")
             self._fetch_repos(topic, query, max_results)
 
-        # Save all results to a single JSON file
+        # Append all results to today's JSON Lines file
         self._save_all_results()
         logger.info("Fetching data end")
 
@@ -125,11 +136,13 @@ class GithubCrawler(BaseCrawler):
 
         # Fetch repositories from GitHub API
         try:
-            response = requests.get(
-                GITHUB_API_URL, params=params, headers=self.headers
+            response = self.session.get(
+                GITHUB_API_URL, params=params, timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            results = response.json()
+            # Parse the raw body with orjson when available; a search page
+            # holds at most 100 items, so it is cheap to parse in one go
+            results = fast_json.loads(response.content)
 
             if results["total_count"] == 0:
                 logger.info(f"No repositories found for query: {query}")
@@ -150,10 +163,10 @@ class GithubCrawler(BaseCrawler):
                 repo_language = (
                     repo["language"] if repo["language"] else "Not specified"
                 )
-                repo_created = repo["created_at"].split("T")[
-                    0
-                ]  # Format as YYYY-MM-DD
-                repo_updated = repo["updated_at"].split("T")[0]
+                # Timestamps are fixed-width ISO 8601 (YYYY-MM-DDTHH:MM:SSZ),
+                # so the date is the first ten characters
+                repo_created = repo["created_at"][:10]
+                repo_updated = repo["updated_at"][:10]
 
                 logger.info(
                     f"Repository: {repo_name}, Stars: {repo_stars}, Language: {repo_language}"
@@ -179,7 +192,13 @@ class GithubCrawler(BaseCrawler):
             return
 
     def _save_all_results(self) -> None:
-        """Save all crawled results to a single JSON file."""
+        """Append all crawled results to today's JSON Lines file.
+
+        Only the new records are written, so saving does not re-read or
+        rewrite earlier runs. The file is gzip-compressed (".jsonl.gz") when
+        ``compress`` is set. Use ``autoscholar.utils.jsonl.load_records``
+        to read the file back into a dictionary keyed by repository ID.
+        """
         if not self.all_results:
             logger.warning("No results to save")
             return
@@ -188,21 +207,10 @@ class GithubCrawler(BaseCrawler):
         output_dir = Path(self.config.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save to a single JSON file with current date
+        # Save to a single JSON Lines file with current date
         today = datetime.date.today().strftime("%Y-%m-%d")
-        output_path = output_dir / f"github_repos_{today}.json"
-
-        # Load existing data if any
-        if output_path.exists():
-            with open(output_path, "r") as f:
-                existing_data = json.load(f)
-        else:
-            existing_data = {}
-
-        # Update with new data
-        existing_data.update(self.all_results)
+        suffix = ".jsonl.gz" if self.config.compress else ".jsonl"
+        output_path = output_dir / f"github_repos_{today}{suffix}"
 
-        # Write back to file
-        with open(output_path, "w") as f:
-            json.dump(existing_data, f, indent=2)
+        append_records(output_path, self.all_results)
         logger.info(f"Saved all repositories to {output_path}")
@@ -0,0 +1,27 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .batched_embedding import BatchedEmbedding
+    from .cache import EmbeddingCache
+    from .openai_batch import OpenAIBatchEmbedding
+
+# Classes are imported on first access (PEP 562), so using the cache does
+# not pull in camel and the OpenAI SDK
+_LAZY_IMPORTS = {
+    "BatchedEmbedding": ".batched_embedding",
+    "EmbeddingCache": ".cache",
+    "OpenAIBatchEmbedding": ".openai_batch",
+}
+
+__all__ = ["BatchedEmbedding", "EmbeddingCache", "OpenAIBatchEmbedding"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(
+        importlib.import_module(_LAZY_IMPORTS[name], __name__), name
+    )
+    globals()[name] = value
+    return value
@@ -0,0 +1,131 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
+
+from camel.embeddings import BaseEmbedding
+
+from autoscholar.embeddings.cache import EmbeddingCache
+
+# Largest number of inputs the OpenAI embeddings endpoint accepts per request
+MAX_BATCH_SIZE = 2048
+# Default number of chunk requests in flight at once
+MAX_WORKERS = 8
+
+
+class BatchedEmbedding(BaseEmbedding[str]):
+    """Embedding model wrapper that sends inputs in request-sized chunks.
+
+    Embedding endpoints cap the number of inputs per request, so calling
+    ``embed_list`` on a wrapped model with a large list fails. This wrapper
+    splits the inputs into chunks of ``batch_size`` and concatenates the
+    results in input order, so each request carries as many inputs as the
+    endpoint allows. The requests are network-bound, so up to
+    ``max_workers`` chunks are sent concurrently. Duplicate texts are sent
+    once, and when a cache is given, only texts it does not already hold
+    are sent to the model.
+    """
+
+    def __init__(
+        self,
+        model: BaseEmbedding[str],
+        batch_size: int = MAX_BATCH_SIZE,
+        max_workers: int = MAX_WORKERS,
+        cache: Optional[EmbeddingCache] = None,
+    ):
+        """Initialize the wrapper.
+
+        Parameters:
+        ----------
+            model: Embedding model used for the requests
+            batch_size: Maximum number of inputs sent in a single request
+            max_workers: Maximum number of concurrent requests
+            cache: Optional persistent cache of embeddings
+        """
+        if batch_size < 1 or max_workers < 1:
+            raise ValueError("batch_size and max_workers must be >= 1")
+        self.model = model
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.cache = cache
+
+    def embed_list(self, objs: List[str], **kwargs: Any) -> List[List[float]]:
+        """Generate embeddings for the given texts.
+
+        Parameters:
+        ----------
+            objs: Texts to embed
+            **kwargs: Extra arguments passed to the wrapped model
+
+        Returns:
+        -------
+            One embedding per text, in input order
+        """
+        # Embed each distinct text once and scatter the results back, so
+        # duplicate papers do not cost extra requests
+        index = {}
+        order = [index.setdefault(obj, len(index)) for obj in objs]
+        if len(index) < len(objs):
+            embeddings = self._embed_unique(list(index), **kwargs)
+            return [embeddings[i] for i in order]
+        return self._embed_unique(objs, **kwargs)
+
+    def _embed_unique(
+        self, objs: List[str], **kwargs: Any
+    ) -> List[List[float]]:
+        """Embed distinct texts, taking known ones from the cache."""
+        if self.cache is None:
+            return self._embed_chunks(objs, **kwargs)
+
+        prefix = self._cache_prefix()
+        keys = [EmbeddingCache.make_key(prefix, obj) for obj in objs]
+        cached = self.cache.get_many(keys)
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+
+        embeddings = [None] * len(objs)
+        for i, key in enumerate(keys):
+            if key in cached:
+                embeddings[i] = cached[key].tolist()
+        if missing:
+            new_embeddings = self._embed_chunks(
+                [objs[i] for i in missing], **kwargs
+            )
+            for i, embedding in zip(missing, new_embeddings):
+                embeddings[i] = embedding
+            self.cache.put_many([keys[i] for i in missing], new_embeddings)
+        return embeddings
+
+    def _cache_prefix(self) -> str:
+        """Identify the wrapped model so cached vectors are not shared."""
+        model_type = getattr(self.model, "model_type", None)
+        name = getattr(model_type, "value", None) or type(self.model).__name__
+        return f"{name}:{self.model.get_output_dim()}"
+
+    def _embed_chunks(
+        self, objs: List[str], **kwargs: Any
+    ) -> List[List[float]]:
+        """Embed texts with the wrapped model in request-sized chunks."""
+        chunks = [
+            objs[start : start + self.batch_size]
+            for start in range(0, len(objs), self.batch_size)
+        ]
+        if len(chunks) <= 1 or self.max_workers == 1:
+            results = [
+                self.model.embed_list(chunk, **kwargs) for chunk in chunks
+            ]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(chunks))
+            ) as executor:
+                futures = [
+                    executor.submit(self.model.embed_list, chunk, **kwargs)
+                    for chunk in chunks
+                ]
+                results = [future.result() for future in futures]
+
+        embeddings = []
+        for result in results:
+            embeddings.extend(result)
+        return embeddings
+
+    def get_output_dim(self) -> int:
+        """Return the output dimension of the wrapped model."""
+        return self.model.get_output_dim()
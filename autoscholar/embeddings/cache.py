@@ -0,0 +1,131 @@
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+# Embeddings are stored as raw float32 bytes
+CACHE_DTYPE = np.float32
+
+
+class EmbeddingCache:
+    """Persistent embedding cache backed by a SQLite database.
+
+    Vectors are stored as float32 bytes under keys built by ``make_key``
+    from the model name, the output dimension and the SHA-256 of the text,
+    so an unchanged text is never embedded twice by the same model and
+    vectors are never reused across models.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Initialize the cache, creating the database if needed.
+
+        Parameters:
+        ----------
+            path: Path to the SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS emb (key TEXT PRIMARY KEY, vec BLOB)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(prefix: str, text: str) -> str:
+        """Build the cache key of a text.
+
+        Parameters:
+        ----------
+            prefix: Model identifier, e.g. "text-embedding-3-small:1536"
+            text: Embedded text
+
+        Returns:
+        -------
+            Cache key
+        """
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{prefix}:{digest}"
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return the cached vector for key, or None if it is missing.
+
+        Parameters:
+        ----------
+            key: Cache key
+
+        Returns:
+        -------
+            Cached vector or None
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Return the cached vectors for the keys that are present.
+
+        Parameters:
+        ----------
+            keys: Cache keys
+
+        Returns:
+        -------
+            Mapping from key to cached vector, without the missing keys
+        """
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+        # Stay well below SQLite's limit on the number of query parameters
+        step = 500
+        with self._lock:
+            for start in range(0, len(unique_keys), step):
+                chunk = unique_keys[start : start + step]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vec FROM emb WHERE key IN ({placeholders})",
+                    chunk,
+                )
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=CACHE_DTYPE)
+        return found
+
+    def put(self, key: str, vector: Sequence[float]) -> None:
+        """Store a vector under key.
+
+        Parameters:
+        ----------
+            key: Cache key
+            vector: Embedding vector
+        """
+        self.put_many([key], [vector])
+
+    def put_many(
+        self, keys: Sequence[str], vectors: List[Sequence[float]]
+    ) -> None:
+        """Store several vectors in a single transaction.
+
+        Parameters:
+        ----------
+            keys: Cache keys
+            vectors: Embedding vectors, one per key
+        """
+        rows = [
+            (key, np.asarray(vector, dtype=CACHE_DTYPE).tobytes())
+            for key, vector in zip(keys, vectors)
+        ]
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO emb (key, vec) VALUES (?, ?)", rows
+                )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM emb").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,205 @@
+import time
+from typing import Any, Dict, List
+
+from camel.embeddings import BaseEmbedding, OpenAIEmbedding
+
+from autoscholar.embeddings.batched_embedding import MAX_BATCH_SIZE
+from autoscholar.utils import fast_json
+from autoscholar.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Inputs below this count are embedded through the synchronous endpoint,
+# where the Batch API's turnaround outweighs its lower price
+MIN_BATCH_INPUTS = 500
+# The Batch API accepts at most this many embedding inputs per job
+MAX_BATCH_INPUTS = 50_000
+# Batch jobs complete within this window
+COMPLETION_WINDOW = "24h"
+MAX_WAIT_SECONDS = 24 * 60 * 60
+# Polling starts at the initial interval and backs off to the maximum
+INITIAL_POLL_INTERVAL = 10.0
+MAX_POLL_INTERVAL = 300.0
+# Terminal states of a batch job other than "completed"
+FAILED_STATES = ("failed", "expired", "cancelled")
+# Amount of a job's error file included in the raised error
+ERROR_DETAIL_CHARS = 2000
+
+
+class OpenAIBatchEmbedding(BaseEmbedding[str]):
+    """OpenAI embedding model that routes large jobs to the Batch API.
+
+    The Batch API costs half as much as the synchronous endpoint and has
+    much higher rate limits, at the price of finishing asynchronously
+    within 24 hours. Lists of at least ``min_batch_inputs`` texts are
+    uploaded as batch jobs of up to ``MAX_BATCH_INPUTS`` texts and polled
+    until they complete; smaller lists go through the wrapped model's
+    synchronous endpoint.
+    """
+
+    def __init__(
+        self,
+        model: OpenAIEmbedding,
+        min_batch_inputs: int = MIN_BATCH_INPUTS,
+        max_wait: float = MAX_WAIT_SECONDS,
+    ):
+        """Initialize the batch embedding model.
+
+        Parameters:
+        ----------
+            model: OpenAI embedding model whose client and settings are used
+            min_batch_inputs: Smallest number of texts sent as a batch job
+            max_wait: Maximum time to wait for a batch job, in seconds
+        """
+        self.model = model
+        self.model_type = model.model_type
+        self.min_batch_inputs = min_batch_inputs
+        self.max_wait = max_wait
+
+    def embed_list(self, objs: List[str], **kwargs: Any) -> List[List[float]]:
+        """Generate embeddings for the given texts.
+
+        Parameters:
+        ----------
+            objs: Texts to embed
+            **kwargs: Extra arguments passed to the wrapped model for
+                synchronous requests
+
+        Returns:
+        -------
+            One embedding per text, in input order
+        """
+        if len(objs) < self.min_batch_inputs:
+            return self.model.embed_list(objs, **kwargs)
+        return self.embed_batch_async(objs)
+
+    def embed_batch_async(self, objs: List[str]) -> List[List[float]]:
+        """Embed texts through Batch API jobs and wait for the results.
+
+        Texts beyond the Batch API's limit of ``MAX_BATCH_INPUTS`` inputs
+        per job are split into several jobs, all submitted before waiting
+        so they run concurrently.
+
+        Parameters:
+        ----------
+            objs: Texts to embed
+
+        Returns:
+        -------
+            One embedding per text, in input order
+
+        Raises:
+        ------
+            RuntimeError: If a job fails, expires, is cancelled or produces
+                no output
+            TimeoutError: If a job does not finish within ``max_wait``
+        """
+        chunks = [
+            objs[start : start + MAX_BATCH_INPUTS]
+            for start in range(0, len(objs), MAX_BATCH_INPUTS)
+        ]
+        batch_ids = [self._submit(chunk) for chunk in chunks]
+
+        embeddings: List[List[float]] = []
+        for batch_id, chunk in zip(batch_ids, chunks):
+            embeddings.extend(self._collect(batch_id, len(chunk)))
+        return embeddings
+
+    def _submit(self, objs: List[str]) -> str:
+        """Upload the requests for some texts and start a batch job."""
+        client = self.model.client
+        input_file = client.files.create(
+            file=("embeddings.jsonl", self._build_requests(objs)),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/embeddings",
+            completion_window=COMPLETION_WINDOW,
+        )
+        logger.info(
+            "Submitted embedding batch %s with %d texts", batch.id, len(objs)
+        )
+        return batch.id
+
+    def _collect(self, batch_id: str, count: int) -> List[List[float]]:
+        """Wait for a batch job and return its embeddings in input order."""
+        client = self.model.client
+        batch = self._wait(batch_id)
+        # The output file is only created when at least one request
+        # succeeded; otherwise all results are in the error file
+        if batch.output_file_id is None:
+            detail = "no error file"
+            if batch.error_file_id is not None:
+                errors = client.files.content(batch.error_file_id).content
+                detail = errors.decode("utf-8", errors="replace")
+                detail = detail[:ERROR_DETAIL_CHARS]
+            raise RuntimeError(
+                f"Embedding batch {batch_id} produced no output: {detail}"
+            )
+        output = client.files.content(batch.output_file_id).content
+        return self._parse_results(output, count)
+
+    def _build_requests(self, objs: List[str]) -> bytes:
+        """Build the JSONL request file, one request per chunk of texts."""
+        body: Dict[str, Any] = {"model": self.model_type.value}
+        # Older models reject the dimensions parameter, so only send it
+        # when it differs from the model's native size
+        if self.model.output_dim != self.model_type.output_dim:
+            body["dimensions"] = self.model.output_dim
+
+        lines = []
+        for start in range(0, len(objs), MAX_BATCH_SIZE):
+            request = {
+                "custom_id": str(start),
+                "method": "POST",
+                "url": "/v1/embeddings",
+                "body": {**body, "input": objs[start : start + MAX_BATCH_SIZE]},
+            }
+            lines.append(fast_json.dumps(request))
+        return b"\n".join(lines) + b"\n"
+
+    def _wait(self, batch_id: str) -> Any:
+        """Poll a batch job with exponential backoff until it completes."""
+        client = self.model.client
+        deadline = time.monotonic() + self.max_wait
+        interval = INITIAL_POLL_INTERVAL
+        while True:
+            batch = client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                return batch
+            if batch.status in FAILED_STATES:
+                raise RuntimeError(
+                    f"Embedding batch {batch_id} ended with status "
+                    f"{batch.status}"
+                )
+            if time.monotonic() + interval > deadline:
+                raise TimeoutError(
+                    f"Embedding batch {batch_id} did not finish in time"
+                )
+            time.sleep(interval)
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+    @staticmethod
+    def _parse_results(output: bytes, count: int) -> List[List[float]]:
+        """Reassemble the embeddings of a batch output file in input order."""
+        embeddings: List[List[float]] = [None] * count
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            result = fast_json.loads(line)
+            start = int(result["custom_id"])
+            response = result.get("response") or {}
+            if response.get("status_code") != 200:
+                raise RuntimeError(
+                    f"Embedding request {start} failed: {result.get('error')}"
+                )
+            for item in response["body"]["data"]:
+                embeddings[start + item["index"]] = item["embedding"]
+        if any(embedding is None for embedding in embeddings):
+            raise RuntimeError("Embedding batch output is missing results")
+        return embeddings
+
+    def get_output_dim(self) -> int:
+        """Return the output dimension of the wrapped model."""
+        return self.model.get_output_dim()
@@ -1,5 +1,27 @@
-from .graph_builder import KnowledgeGraphBuilder
-from .knowledge_graph import KnowledgeGraph
-from .paper import Paper
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .graph_builder import KnowledgeGraphBuilder
+    from .knowledge_graph import KnowledgeGraph
+    from .paper import Paper
+
+# Classes are imported on first access (PEP 562), so importing Paper does
+# not pull in networkx and the embedding SDKs used by the graph builder
+_LAZY_IMPORTS = {
+    "Paper": ".paper",
+    "KnowledgeGraph": ".knowledge_graph",
+    "KnowledgeGraphBuilder": ".graph_builder",
+}
 
 __all__ = ["Paper", "KnowledgeGraph", "KnowledgeGraphBuilder"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(
+        importlib.import_module(_LAZY_IMPORTS[name], __name__), name
+    )
+    globals()[name] = value
+    return value
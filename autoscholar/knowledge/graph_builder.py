@@ -1,34 +1,98 @@
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-import networkx as nx
-from camel.embeddings import BaseEmbedding
+import numpy as np
+from scipy import sparse
 
 from autoscholar.knowledge.knowledge_graph import KnowledgeGraph
 from autoscholar.knowledge.paper import Paper
 from autoscholar.utils.logger import setup_logger
 from autoscholar.utils.similarity import (
+    blas_threads,
     compute_similarity_matrix,
-    filter_connections_by_threshold,
+    dequantize_embeddings,
+    find_similar_pairs,
+    quantize_embeddings,
 )
 
+if TYPE_CHECKING:
+    from camel.embeddings import BaseEmbedding
+
+    from autoscholar.embeddings import EmbeddingCache
+
 logger = setup_logger(__name__)
 
 
 class KnowledgeGraphBuilder:
     """Class for building and analyzing knowledge graphs of academic papers."""
 
-    def __init__(self, embedding_model: Optional[BaseEmbedding] = None):
+    def __init__(
+        self,
+        embedding_model: Optional["BaseEmbedding"] = None,
+        embedding_cache: Optional["EmbeddingCache"] = None,
+        quantize: bool = False,
+    ):
         """Initialize knowledge graph builder.
 
         Parameters:
         ----------
-            embedding_model: BaseEmbedding instance (will create a new one if None)
+            embedding_model: BaseEmbedding instance (will create a new one if None).
+                It is wrapped in a BatchedEmbedding so that large paper lists
+                are sent in request-sized chunks.
+            embedding_cache: Optional persistent cache, so papers whose text
+                has not changed are not embedded again
+            quantize: Whether to keep the embeddings as int8 with per-row
+                scales after the graph is built, using a quarter of the
+                memory of float32
         """
+        if embedding_model is not None:
+            # Importing BatchedEmbedding pulls in camel, so only do it when
+            # a model is given
+            from autoscholar.embeddings import BatchedEmbedding
+
+            if not isinstance(embedding_model, BatchedEmbedding):
+                embedding_model = BatchedEmbedding(
+                    embedding_model, cache=embedding_cache
+                )
         self.embedding_model = embedding_model
         self.graph: Optional[KnowledgeGraph] = None
         self.papers: Optional[List[Paper]] = None
+        self.quantize = quantize
         self.embeddings = None
-        self.similarity_matrix = None
+        # Per-row scales of the embeddings when they are stored as int8
+        self.embedding_scales: Optional[np.ndarray] = None
+        # Cached similarity matrix and the embeddings it was computed from
+        self._similarity_matrix: Optional[np.ndarray] = None
+        self._similarity_source: Optional[tuple] = None
+
+    @property
+    def similarity_matrix(self) -> Optional[np.ndarray]:
+        """Full similarity matrix of the embeddings.
+
+        Building the graph only keeps the pairs above the threshold, so the
+        full matrix is computed from the embeddings on first access. It is
+        then kept until the embeddings change, and can also be assigned.
+        """
+        source = (self.embeddings, self.embedding_scales)
+        if self._similarity_source is not None and all(
+            a is b for a, b in zip(self._similarity_source, source)
+        ):
+            return self._similarity_matrix
+        if self.embeddings is None:
+            return None
+        embeddings = self.embeddings
+        if self.embedding_scales is not None:
+            embeddings = dequantize_embeddings(
+                embeddings, self.embedding_scales
+            )
+        self.similarity_matrix = compute_similarity_matrix(embeddings)
+        return self._similarity_matrix
+
+    @similarity_matrix.setter
+    def similarity_matrix(self, value: Optional[np.ndarray]) -> None:
+        self._similarity_matrix = value
+        # The value belongs to the current embeddings and is recomputed
+        # once they are replaced
+        self._similarity_source = (self.embeddings, self.embedding_scales)
 
     def build_graph(
         self,
@@ -62,7 +126,7 @@ class KnowledgeGraphBuilder:
                     "Some embeddings are None. Re-generating embeddings."
                 )
                 texts = [paper.get_text_for_embedding() for paper in papers]
-                self.embeddings = self.embedding_model.embed_batch(texts)
+                self.embeddings = self.embedding_model.embed_list(texts)
 
         else:
             logger.info("Using provided embeddings.")
@@ -70,36 +134,38 @@ class KnowledgeGraphBuilder:
                 embedding_dict[paper.paper_id] for paper in papers
             ]
 
-        # Compute similarity matrix
-        self.similarity_matrix = compute_similarity_matrix(self.embeddings)
-
-        # Create graph
-        G = nx.Graph()
+        # Stack the embeddings into one contiguous float32 matrix, which
+        # takes far less memory than nested lists of Python floats and lets
+        # the similarity matrix be computed with a single GEMM
+        self.embeddings = np.ascontiguousarray(
+            self.embeddings, dtype=np.float32
+        )
 
-        # Add nodes
-        for i, paper in enumerate(papers):
-            G.add_node(
-                i,
-                paper_id=paper.paper_id,
-                title=paper.title,
-                abstract=paper.abstract,
+        # Find the pairs above the threshold without keeping the similarity
+        # matrix, and store them in both directions as a sparse CSR
+        # adjacency; the networkx graph is only built from it on demand
+        n = len(papers)
+        with blas_threads():
+            rows, cols, weights = find_similar_pairs(
+                self.embeddings, similarity_threshold
             )
-
-        # Get connections above threshold
-        connections = filter_connections_by_threshold(
-            self.similarity_matrix, threshold=similarity_threshold
+        adjacency = sparse.csr_array(
+            (
+                np.concatenate([weights, weights]),
+                (np.concatenate([rows, cols]), np.concatenate([cols, rows])),
+            ),
+            shape=(n, n),
         )
 
-        # Add edges
-        for i, j, similarity in connections:
-            if i in G and j in G:
-                G.add_edge(i, j, weight=similarity)
-            else:
-                print(
-                    f"Warning: Attempted to add edge between non-existent nodes ({i}, {j}). Skipping."
-                )
+        # The edges are computed from the float32 embeddings; only the copy
+        # kept afterwards is quantized
+        self.embedding_scales = None
+        if self.quantize:
+            self.embeddings, self.embedding_scales = quantize_embeddings(
+                self.embeddings
+            )
 
         # Store graph as KnowledgeGraph instance
-        self.graph = KnowledgeGraph(G, self.papers)
+        self.graph = KnowledgeGraph(papers=self.papers, adjacency=adjacency)
 
         return self.graph
@@ -1,30 +1,104 @@
-from typing import List
+from typing import List, Optional, Sequence, Union
 
 import networkx as nx
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
 
 from autoscholar.knowledge.paper import Paper
 
 
 class KnowledgeGraph:
-    """Encapsulates the knowledge graph structure and operations."""
+    """Encapsulates the knowledge graph structure and operations.
 
-    def __init__(self, graph: nx.Graph, papers: List[Paper]):
+    The graph can be backed by a networkx graph, by a sparse CSR adjacency
+    matrix, or both. The CSR form stores each edge as a single float and
+    runs graph algorithms in compiled code, so it is the fast path for
+    large similarity graphs; the networkx graph is built from it only when
+    ``graph`` is first accessed.
+    """
+
+    def __init__(
+        self,
+        graph: Optional[nx.Graph] = None,
+        papers: Optional[List[Paper]] = None,
+        adjacency: Optional[sparse.csr_array] = None,
+    ):
         """Initialize the KnowledgeGraph.
 
         Parameters:
         ----------
             graph: The networkx graph object representing the knowledge graph.
             papers: The list of paper dictionaries used to build the graph.
+            adjacency: Symmetric CSR adjacency matrix whose entry (i, j) is
+                the weight of the edge between papers i and j.
         """
+        if graph is None and adjacency is None:
+            raise ValueError("Either graph or adjacency must be provided")
         self._graph = graph
-        self._papers = papers
+        self._papers = papers or []
+        self._adjacency = adjacency
 
     @property
     def graph(self) -> nx.Graph:
         """Returns the underlying networkx graph object."""
+        if self._graph is None:
+            self._graph = self._graph_from_adjacency()
         return self._graph
 
     @property
     def papers(self) -> List[Paper]:
         """Returns the list of paper dictionaries."""
         return self._papers
+
+    @property
+    def adjacency(self) -> sparse.csr_array:
+        """Returns the weighted adjacency matrix in CSR format."""
+        if self._adjacency is None:
+            self._adjacency = sparse.csr_array(
+                nx.to_scipy_sparse_array(self._graph, weight="weight")
+            )
+        return self._adjacency
+
+    def shortest_path(
+        self,
+        indices: Optional[Union[int, Sequence[int]]] = None,
+        unweighted: bool = True,
+    ) -> np.ndarray:
+        """Compute shortest path lengths on the CSR adjacency.
+
+        Edge weights are similarities rather than distances, so path
+        lengths count hops by default.
+
+        Parameters:
+        ----------
+            indices: Source node index or indices (all nodes if None)
+            unweighted: Whether to count hops instead of summing weights
+
+        Returns:
+        -------
+            Matrix of path lengths from each source to every node, with
+            ``inf`` for unreachable nodes
+        """
+        return csgraph.shortest_path(
+            self.adjacency,
+            directed=False,
+            unweighted=unweighted,
+            indices=indices,
+        )
+
+    def _graph_from_adjacency(self) -> nx.Graph:
+        """Build the networkx graph from the CSR adjacency."""
+        G = nx.Graph()
+        for i, paper in enumerate(self._papers):
+            G.add_node(
+                i,
+                paper_id=paper.paper_id,
+                title=paper.title,
+                abstract=paper.abstract,
+            )
+        upper = sparse.triu(self._adjacency, k=1, format="coo")
+        G.add_weighted_edges_from(
+            zip(upper.row.tolist(), upper.col.tolist(), upper.data.tolist())
+        )
+        return G
@@ -1,9 +1,51 @@
 # scholarauto/knowledge/paper.py
 
-import json
+import functools
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from autoscholar.utils import fast_json
+
+# Token budget of embedding inputs, below the 8192-token context of the
+# OpenAI embedding models
+MAX_EMBEDDING_TOKENS = 8000
+# Conservative characters-per-token ratio used when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+# Maximum number of threads reading paper files concurrently
+MAX_LOAD_WORKERS = 32
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding() -> Optional[Any]:
+    """Load the tokenizer of the OpenAI embedding models, if available."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except (ImportError, OSError, ValueError):
+        return None
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Trim text to at most max_tokens tokens.
+
+    Every token covers at least one character, so texts that are short
+    enough are returned without tokenizing them. Without tiktoken, the text
+    is cut at ``CHARS_PER_TOKEN`` characters per token.
+    """
+    if len(text) <= max_tokens:
+        return text
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[: max_tokens * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
 
 
 class Paper:
@@ -13,6 +55,21 @@ class Paper:
     Additional metadata can be stored in meta_info dictionary.
     """
 
+    # Slots keep the per-paper memory small for large corpora
+    __slots__ = (
+        "id",
+        "paper_id",
+        "title",
+        "abstract",
+        "url",
+        "pdf_url",
+        "full_text",
+        "embedding",
+        "code_url",
+        "meta_info",
+        "_embedding_text",
+    )
+
     def __init__(
         self,
         title: str = "",
@@ -23,7 +80,7 @@ class Paper:
         pdf_url: Optional[str] = None,
         code_url: Optional[str] = None,
         full_text: Optional[str] = None,
-        embedding: Optional[List[float]] = None,
+        embedding: Optional[Sequence[float]] = None,
         meta_info: Optional[Dict[str, Any]] = None,
     ):
         """Initialize a Paper knowledge entity.
@@ -46,9 +103,14 @@ class Paper:
         self.url = url
         self.pdf_url = pdf_url
         self.full_text = full_text
-        self.embedding = embedding
+        self.embedding = None
+        if embedding is not None:
+            self.set_embedding(embedding)
         self.code_url = code_url
         self.meta_info = meta_info or {}
+        # (title, abstract, max_tokens, text) of the last default embedding
+        # text, reused while the title and abstract are unchanged
+        self._embedding_text = None
 
         # Embedding is not stored directly as an attribute
         # but can be added to meta_info if needed temporarily
@@ -116,21 +178,41 @@ class Paper:
         return cls(**attrs)
 
     def get_text_for_embedding(
-        self, construct_fn: Optional[Callable[["Paper"], str]] = None
+        self,
+        construct_fn: Optional[Callable[["Paper"], str]] = None,
+        max_tokens: Optional[int] = MAX_EMBEDDING_TOKENS,
     ) -> str:
         """Get concatenated text used for creating embeddings.
 
         Parameters:
         ----------
             construct_fn: Function to construct the text from the paper
+            max_tokens: Maximum number of tokens of the text, so long inputs
+                such as full texts fit the embedding model's context
+                (None disables truncation)
 
         Returns:
             Concatenated text of title and abstract
         """
-        if construct_fn is None:
-            return f"{self.title}\n\n{self.abstract}"
-        else:
-            return construct_fn(self)
+        if construct_fn is not None:
+            text = construct_fn(self)
+            if max_tokens is None:
+                return text
+            return _truncate_to_tokens(text, max_tokens)
+
+        cached = self._embedding_text
+        if (
+            cached is not None
+            and cached[0] is self.title
+            and cached[1] is self.abstract
+            and cached[2] == max_tokens
+        ):
+            return cached[3]
+        text = f"{self.title}\n\n{self.abstract}"
+        if max_tokens is not None:
+            text = _truncate_to_tokens(text, max_tokens)
+        self._embedding_text = (self.title, self.abstract, max_tokens, text)
+        return text
 
     def to_json(self) -> str:
         """Convert the paper to a JSON string.
@@ -138,7 +220,7 @@ class Paper:
         Returns:
             JSON string representation
         """
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        return fast_json.dumps(self.to_dict(), indent=True).decode("utf-8")
 
     def __str__(self) -> str:
         """Get string representation of the paper.
@@ -156,13 +238,16 @@ class Paper:
         """
         return f"Paper(paper_id='{self.paper_id}', title='{self.title}')"
 
-    def set_embedding(self, embedding: List[float]):
+    def set_embedding(self, embedding: Sequence[float]):
         """Set the embedding of the paper.
 
+        The embedding is kept as a float32 array, which takes a fraction of
+        the memory of a list of Python floats.
+
         Parameters:
-            embedding: Embedding of the paper
+            embedding: Embedding of the paper (list or numpy array)
         """
-        self.embedding = embedding
+        self.embedding = np.asarray(embedding, dtype=np.float32)
 
     @classmethod
     def load_paper_from_path(cls, json_path: str) -> "Paper":
@@ -174,8 +259,7 @@ class Paper:
         Returns:
             Paper object
         """
-        with open(json_path, "r", encoding="utf-8") as f:
-            paper_data = json.load(f)
+        paper_data = fast_json.loads(Path(json_path).read_bytes())
 
         if not isinstance(paper_data, dict):
             raise ValueError("JSON file must be a dictionary")
@@ -188,13 +272,18 @@ class Paper:
     ) -> List["Paper"]:
         """Create a Paper object from a JSON file.
 
+        Loading is I/O-bound, so the files are read by a thread pool; the
+        papers are returned in the order of the paths.
+
         Parameters:
             json_path: Path to the JSON file containing paper data
         """
-        papers = []
-        for json_path in json_path_list:
-            papers.append(cls.load_paper_from_path(json_path))
-        return papers
+        if len(json_path_list) <= 1:
+            return [cls.load_paper_from_path(path) for path in json_path_list]
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_LOAD_WORKERS, len(json_path_list))
+        ) as executor:
+            return list(executor.map(cls.load_paper_from_path, json_path_list))
 
     @classmethod
     def from_json_list(cls, json_str: str) -> List["Paper"]:
@@ -206,7 +295,7 @@ class Paper:
         Returns:
             List of Paper objects
         """
-        papers_data = json.loads(json_str)
+        papers_data = fast_json.loads(json_str)
 
         if not isinstance(papers_data, list):
             raise ValueError("JSON string must contain a list of paper objects")
@@ -224,4 +313,4 @@ class Paper:
             JSON string representation of the list
         """
         papers_data = [paper.to_dict() for paper in papers]
-        return json.dumps(papers_data, ensure_ascii=False, indent=2)
+        return fast_json.dumps(papers_data, indent=True).decode("utf-8")
@@ -1,15 +1,16 @@
 import os
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import dotenv
-from llama_cloud_services import LlamaParse
-from llama_cloud_services.parse.types import JobResult
 
 from ..utils.logger import setup_logger
 from .parse_tool import STRUCTURED_TYPES, ParseTool
 
+if TYPE_CHECKING:
+    from llama_cloud_services.parse.types import JobResult
+
 dotenv.load_dotenv()
 
 
@@ -58,6 +59,9 @@ class LlamaParser(ParseTool):
         self.system_prompt_append = system_prompt_append
         self._build_config()
 
+        # Imported here so the SDK is only loaded when a parser is created
+        from llama_cloud_services import LlamaParse
+
         self.llama_parse = LlamaParse(api_key=self.api_key, **self.parse_config)
 
     def _build_config(self):
@@ -83,7 +87,7 @@ class LlamaParser(ParseTool):
 
     def parse(
         self, source: Union[str, Path, bytes], **kwargs: Any
-    ) -> JobResult:
+    ) -> "JobResult":
         """Parse the source into a JobResult object."""
         try:
             return self.llama_parse.parse(source, **kwargs)
@@ -1,14 +1,53 @@
+import hashlib
 import json
+import os
 import re
 import subprocess
+import tempfile
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 from ..knowledge import Paper
+from ..utils import fast_json
 from ..utils.logger import setup_logger
 from .parse_tool import STRUCTURED_TYPES, ParseTool
 
+# A line break followed by one or more whitespace-only lines
+_BLANK_LINES_RE = re.compile(r"\n(?:[^\S\n]*\n)+")
+# A line break directly before a heading
+_HEADING_RE = re.compile(r"\n(#+)")
+# A character that is not alphanumeric (underscores map to themselves)
+_NON_WORD_RE = re.compile(r"\W")
+# Suggested location for the markdown conversion cache
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "autoscholar" / "md"
+# Size of the blocks read when hashing a PDF
+HASH_CHUNK_SIZE = 1024 * 1024
+# Amount of marker_single's stderr reported when a conversion fails
+STDERR_TAIL_BYTES = 4096
+# Concurrent marker_single processes; more workers compete for the same
+# CPU or GPU and stop paying off
+MAX_CONVERT_WORKERS = min(os.cpu_count() or 1, 4)
+
+logger = setup_logger(__name__)
+
+
+def _read_tail(file: Any, size: int = STDERR_TAIL_BYTES) -> str:
+    """Decode the last bytes of a binary file."""
+    file.seek(0, os.SEEK_END)
+    file.seek(max(0, file.tell() - size))
+    return file.read().decode("utf-8", errors="replace")
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """Write a text file so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+
 
 class MarkdownConverter(ABC):
     """Abstract base class for PDF to Markdown converters."""
@@ -48,8 +87,6 @@ class MarkerSingleConverter(MarkdownConverter):
         Returns:
             String containing markdown representation of the PDF
         """
-        logger = setup_logger(__name__)
-
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
@@ -65,12 +102,19 @@ class MarkerSingleConverter(MarkdownConverter):
             if extract_images:
                 cmd.append("--extract_images")
 
-            # Execute conversion command
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Execute conversion command. The result is read from the
+            # output file, so stdout is discarded and stderr, where marker
+            # writes its progress, is spooled to a file instead of memory
+            with tempfile.TemporaryFile() as stderr_file:
+                result = subprocess.run(
+                    cmd, stdout=subprocess.DEVNULL, stderr=stderr_file
+                )
 
-            # Check if successful
-            if result.returncode != 0:
-                raise Exception(f"Conversion failed: {result.stderr}")
+                # Check if successful
+                if result.returncode != 0:
+                    raise Exception(
+                        f"Conversion failed: {_read_tail(stderr_file)}"
+                    )
 
             # Get output file path
             output_path = pdf_path.with_suffix(".md")
@@ -88,6 +132,83 @@ class MarkerSingleConverter(MarkdownConverter):
             raise
 
 
+class MarkerLibraryConverter(MarkdownConverter):
+    """Converter that calls marker as a Python library.
+
+    marker_single starts a new Python process and loads its models for
+    every PDF. This converter loads the models once and keeps them in
+    memory, so only the first conversion pays the startup cost. It
+    requires marker to be installed in the same environment and is opt-in:
+    pass an instance to ``PDF2MarkdownTool`` to use it.
+
+    Using one instance from several threads, e.g. through
+    ``PDF2MarkdownTool.parse_many``, keeps a single copy of the models in
+    memory, whereas one process per conversion would each load their own.
+    marker's converter is not documented as thread-safe, so calls into it
+    are serialized; the threads still overlap reading, caching and saving
+    images around those calls.
+    """
+
+    def __init__(self, **config: Any):
+        """Load marker's models and create the converter.
+
+        Args:
+            **config: Configuration passed to marker's PdfConverter
+        """
+        from marker.converters.pdf import PdfConverter
+        from marker.models import create_model_dict
+        from marker.output import text_from_rendered
+
+        self._text_from_rendered = text_from_rendered
+        self._converter = PdfConverter(
+            artifact_dict=create_model_dict(), config=config or None
+        )
+        self._converter_lock = threading.Lock()
+
+    def convert(
+        self,
+        pdf_path: Path,
+        extract_images: bool = False,
+        output_dir: Optional[str] = None,
+        **options,
+    ) -> str:
+        """Convert PDF to markdown using the loaded marker models.
+
+        Args:
+            pdf_path: Path to the PDF file
+            extract_images: Whether to save the extracted images
+            output_dir: Directory the images are saved to (defaults to the
+                PDF's directory)
+            **options: Unused, accepted for compatibility with
+                MarkerSingleConverter
+
+        Returns:
+            String containing markdown representation of the PDF
+        """
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+        logger.info(f"Converting {pdf_path} to markdown using marker")
+
+        try:
+            with self._converter_lock:
+                rendered = self._converter(str(pdf_path))
+            markdown_content, _, images = self._text_from_rendered(rendered)
+
+            if extract_images and images:
+                image_dir = Path(output_dir) if output_dir else pdf_path.parent
+                image_dir.mkdir(parents=True, exist_ok=True)
+                for name, image in images.items():
+                    image.save(image_dir / name)
+
+            logger.info("PDF conversion completed successfully")
+            return markdown_content
+
+        except Exception as e:
+            logger.error(f"Error during conversion: {str(e)}")
+            raise
+
+
 class PDF2MarkdownTool(ParseTool):
     """Tool for converting PDFs to Markdown format."""
 
@@ -97,6 +218,8 @@ class PDF2MarkdownTool(ParseTool):
         cleanup: bool = True,
         extract_images: bool = False,
         output_dir: Optional[str] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        num_workers: int = MAX_CONVERT_WORKERS,
     ):
         """Initialize the PDF to Markdown conversion tool.
 
@@ -105,12 +228,17 @@ class PDF2MarkdownTool(ParseTool):
             cleanup: Whether to clean up the converted markdown content
             extract_images: Whether to extract images from the PDF
             output_dir: Output directory for converted files
+            cache_dir: Directory caching converted markdown by PDF content
+                and options, e.g. DEFAULT_CACHE_DIR (None disables caching)
+            num_workers: Number of PDFs converted concurrently by parse_many
         """
         self.converter = converter or MarkerSingleConverter()
         self.cleanup = cleanup
         self.extract_images = extract_images
         self.output_dir = output_dir
-        self.logger = setup_logger(__name__)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.num_workers = num_workers
+        self.logger = logger
 
     def parse(
         self, source: Union[str, Path, bytes], **kwargs: Any
@@ -133,7 +261,14 @@ class PDF2MarkdownTool(ParseTool):
             **kwargs,
         }
 
-        markdown_content = self.converter.convert(pdf_path, **options)
+        cache_path = self._cache_path(pdf_path, options)
+        if cache_path is not None and cache_path.exists():
+            self.logger.info(f"Using cached markdown for {pdf_path}")
+            markdown_content = cache_path.read_text(encoding="utf-8")
+        else:
+            markdown_content = self.converter.convert(pdf_path, **options)
+            if cache_path is not None:
+                _write_atomic(cache_path, markdown_content)
 
         # Clean up content if needed
         if self.cleanup:
@@ -141,19 +276,101 @@ class PDF2MarkdownTool(ParseTool):
 
         return markdown_content
 
+    def parse_many(
+        self,
+        sources: List[Union[str, Path]],
+        num_workers: Optional[int] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Convert several PDFs to markdown concurrently.
+
+        Each conversion runs marker_single in its own subprocess, so a
+        thread pool is enough to keep several of them busy at once.
+
+        Args:
+            sources: Paths to the PDF files
+            num_workers: Number of concurrent conversions (defaults to the
+                tool's num_workers)
+            **kwargs: Additional arguments passed to ``parse``
+
+        Returns:
+            Markdown content of each PDF, in the order of the sources
+        """
+        with ThreadPoolExecutor(
+            max_workers=num_workers or self.num_workers
+        ) as executor:
+            futures = [
+                executor.submit(self.parse, source, **kwargs)
+                for source in sources
+            ]
+            return [future.result() for future in futures]
+
     def get_format(self) -> STRUCTURED_TYPES:
         return STRUCTURED_TYPES.MARKDOWN
 
+    def _cache_path(
+        self, pdf_path: Path, options: Dict[str, Any]
+    ) -> Optional[Path]:
+        """Return the cache file of a conversion, or None if not cached.
+
+        The key combines the SHA-256 of the PDF bytes with the converter
+        and its options, so changing any of them converts the PDF again.
+        """
+        if self.cache_dir is None or not pdf_path.is_file():
+            return None
+        key = json.dumps(
+            {
+                "pdf": self._content_hash(pdf_path),
+                "converter": type(self.converter).__name__,
+                "options": options,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.md"
+
+    def _content_hash(self, pdf_path: Path) -> str:
+        """Return the SHA-256 of a PDF, reusing it while the file is unchanged.
+
+        A sidecar file per PDF path records the size and modification time
+        the hash was computed for, so unchanged files are not read again.
+        """
+        stat = pdf_path.stat()
+        path_key = str(pdf_path.resolve()).encode("utf-8")
+        meta_path = (
+            self.cache_dir / f"{hashlib.sha1(path_key).hexdigest()}.meta.json"
+        )
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if (
+                meta["size"] == stat.st_size
+                and meta["mtime"] == stat.st_mtime_ns
+            ):
+                return meta["sha256"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        sha256 = hashlib.sha256()
+        with open(pdf_path, "rb") as f:
+            for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                sha256.update(block)
+        digest = sha256.hexdigest()
+        meta = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "sha256": digest,
+        }
+        _write_atomic(meta_path, json.dumps(meta))
+        return digest
+
     def _clean_markdown(self, content: str) -> str:
         """Clean up the markdown content."""
         # Delete extra blank lines
-        content = "\n".join(
-            line for line in content.split("\n") if line.strip()
-        )
+        content = _BLANK_LINES_RE.sub("\n", content)
 
         # Ensure titles have blank lines before and after
-        # Use regex to avoid multiple replacements
-        content = re.sub(r"\n(#+)", r"\n\n\1", content)
+        content = _HEADING_RE.sub(r"\n\n\1", content)
 
         return content.strip()
 
@@ -169,9 +386,10 @@ class PDF2MarkdownTool(ParseTool):
         Returns:
             Paper object with parsed content
         """
+        pdf_path = Path(source)
         try:
             # Parse the PDF
-            content = self.parse(source)
+            content = self.parse(pdf_path)
 
             # Create a Paper object
             paper = Paper(title=title or "")
@@ -181,7 +399,6 @@ class PDF2MarkdownTool(ParseTool):
             paper.full_text = content
 
             # Set the PDF URL
-            pdf_path = Path(source) if isinstance(source, str) else source
             paper.pdf_url = f"file://{pdf_path.absolute()}"
 
             return paper
@@ -214,15 +431,16 @@ class PDF2MarkdownTool(ParseTool):
             base_name = paper.title or paper.id
             # Replace spaces and special characters
             # e.g. "Hello World" -> "Hello_World"
-            base_name = "".join(c if c.isalnum() else "_" for c in base_name)
+            base_name = _NON_WORD_RE.sub("_", base_name)
             output_path = f"{base_name}.json"
 
         try:
             output_path = Path(output_path)
 
-            # Save as JSON
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(paper.to_dict(), f, ensure_ascii=False, indent=2)
+            # Save as JSON; fast_json writes UTF-8 bytes directly
+            output_path.write_bytes(
+                fast_json.dumps(paper.to_dict(), indent=True)
+            )
 
             self.logger.info(f"Saved paper content to {output_path}")
             return str(output_path)
@@ -3,6 +3,7 @@ from camel.models import ModelFactory
 from camel.types import ModelPlatformType, ModelType
 from camel.agents import ChatAgent
 from pathlib import Path
+import os
 import subprocess
 
 # Configure logging
@@ -11,13 +12,57 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Fixed parts of the prompt, placed around the paper, the image list and
+# the LaTeX template
+PROMPT_HEADER = """
+    你是一位精通 LaTeX 的学术助手。以下是用户提供的内容：
+
+    1. 一篇论文的内容（Markdown 格式）
+    2. 图像文件名列表
+    3. 一个 LaTeX 模板，其中部分内容需要填写
+
+    你的任务是：
+    - 阅读论文内容和图像文件名
+    - 理解论文的主旨、方法和结果
+    - 仅填写 LaTeX 模板中待填写的部分，保留其原有结构和格式
+    - 内容应尽量紧凑，突出重点
+    - 注意处理特殊字符，例如将 % 替换为 \\%
+    - 返回完整的 LaTeX 源码，不要包含多余的说明
+    - 不要返回 ``` latex ... ```，直接返回完整的文件内容
+
+    ----------------------
+    [论文内容]
+    """
+PROMPT_IMAGES = """
+
+    ----------------------
+    [图像文件]
+    """
+PROMPT_TEMPLATE = """
+
+    ----------------------
+    [LaTeX 模板]
+    """
+PROMPT_FOOTER = """
+
+    ----------------------
+    请补全上述 LaTeX 模板并返回完整代码。
+    """
+
 try:
     # Step 1. Convert paper(pdf) to markdown
     logger.info("Starting PDF to Markdown conversion...")
     pdf_file_path = "autoscholar/scholar_summary/demo/2503.08696.pdf"
     markdown_output_dir = Path("autoscholar/scholar_summary/demo/")
     markdown_file_path = markdown_output_dir / "2503.08696/2503.08696.md"
-    image_file_list = sorted(markdown_output_dir.glob("*.jpeg"))
+    image_file_list = sorted(
+        (
+            entry
+            for entry in os.scandir(markdown_output_dir)
+            if entry.name.endswith(".jpeg") and not entry.name.startswith(".")
+        ),
+        key=lambda entry: entry.name,
+    )
     latex_template_file = Path("autoscholar/scholar_summary/demo/template.tex")
     latex_output_file = Path(
         "autoscholar/scholar_summary/demo/2503.08696/demo_summary.tex"
@@ -47,37 +92,19 @@ try:
 
     image_file_names = "\n".join([f"- {img.name}" for img in image_file_list])
 
-    prompt_text = f"""
-    你是一位精通 LaTeX 的学术助手。以下是用户提供的内容：
-
-    1. 一篇论文的内容（Markdown 格式）
-    2. 图像文件名列表
-    3. 一个 LaTeX 模板，其中部分内容需要填写
-
-    你的任务是：
-    - 阅读论文内容和图像文件名
-    - 理解论文的主旨、方法和结果
-    - 仅填写 LaTeX 模板中待填写的部分，保留其原有结构和格式
-    - 内容应尽量紧凑，突出重点
-    - 注意处理特殊字符，例如将 % 替换为 \%
-    - 返回完整的 LaTeX 源码，不要包含多余的说明
-    - 不要返回 ``` latex ... ```，直接返回完整的文件内容
-
-    ----------------------
-    [论文内容]
-    {paper_content}
-
-    ----------------------
-    [图像文件]
-    {image_file_names}
-
-    ----------------------
-    [LaTeX 模板]
-    {latex_template_content}
-
-    ----------------------
-    请补全上述 LaTeX 模板并返回完整代码。
-    """
+    # The paper can be several MB of text, so the prompt is assembled with
+    # a single join instead of formatting it into an f-string
+    prompt_text = "".join(
+        [
+            PROMPT_HEADER,
+            paper_content,
+            PROMPT_IMAGES,
+            image_file_names,
+            PROMPT_TEMPLATE,
+            latex_template_content,
+            PROMPT_FOOTER,
+        ]
+    )
 
     response = chat_agent.step(prompt_text)
     completed_latex_content = response.msgs[0].content
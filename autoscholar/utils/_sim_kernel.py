@@ -0,0 +1,80 @@
+"""Numba kernel that finds similar pairs without building the full matrix.
+
+numba is optional. When it is not installed ``NUMBA_AVAILABLE`` is False
+and callers fall back to the BLAS path in ``autoscholar.utils.similarity``.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = prange = None
+
+NUMBA_AVAILABLE = njit is not None
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _count_pairs(X, threshold, counts):
+        n, d = X.shape
+        for i in prange(n):
+            count = 0
+            for j in range(i + 1, n):
+                s = 0.0
+                for k in range(d):
+                    s += X[i, k] * X[j, k]
+                if s >= threshold:
+                    count += 1
+            counts[i] = count
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _fill_pairs(X, threshold, offsets, rows, cols, sims):
+        n, d = X.shape
+        for i in prange(n):
+            idx = offsets[i]
+            for j in range(i + 1, n):
+                s = 0.0
+                for k in range(d):
+                    s += X[i, k] * X[j, k]
+                if s >= threshold:
+                    rows[idx] = i
+                    cols[idx] = j
+                    sims[idx] = min(s, 1.0)
+                    idx += 1
+
+
+def threshold_pairs(
+    normalized: np.ndarray, threshold: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find the pairs i < j whose dot product is at least threshold.
+
+    The upper triangle is walked twice, once to count the pairs of each
+    row and once to write them at precomputed offsets, so rows can be
+    processed in parallel without a shared counter and only the kept
+    pairs are ever stored.
+
+    Parameters:
+    ----------
+        normalized: Matrix of L2-normalized embeddings (n_samples, dim)
+        threshold: Minimum similarity of a returned pair
+
+    Returns:
+    -------
+        Row indices, column indices and similarities, ordered by row and
+        then column
+    """
+    n = normalized.shape[0]
+    counts = np.zeros(n, dtype=np.int64)
+    _count_pairs(normalized, threshold, counts)
+    offsets = np.zeros(n, dtype=np.int64)
+    np.cumsum(counts[:-1], out=offsets[1:])
+
+    total = int(counts.sum())
+    rows = np.empty(total, dtype=np.int64)
+    cols = np.empty(total, dtype=np.int64)
+    sims = np.empty(total, dtype=normalized.dtype)
+    _fill_pairs(normalized, threshold, offsets, rows, cols, sims)
+    return rows, cols, sims
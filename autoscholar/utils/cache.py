@@ -0,0 +1,101 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from autoscholar.utils import fast_json
+from autoscholar.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class JsonCache:
+    """Persistent key-value cache backed by a single JSON file.
+
+    Every entry is stored together with the time it was written, so stale
+    entries can be expired through ``ttl``. The file is only written when
+    ``save`` is called, which keeps lookups and updates in memory.
+    """
+
+    def __init__(self, path: Union[str, Path], ttl: Optional[float] = None):
+        """Initialize the cache, loading existing entries from disk.
+
+        Parameters:
+        ----------
+            path: Path to the JSON file backing the cache
+            ttl: Maximum age of an entry in seconds (None means no expiry)
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._data = {}
+
+        if self.path.exists():
+            try:
+                self._data = fast_json.loads(self.path.read_bytes())
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable cache {self.path}: {e}")
+
+    def _is_fresh(self, entry: list) -> bool:
+        return self.ttl is None or time.time() - entry[1] < self.ttl
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and self._is_fresh(entry)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or stale.
+
+        Parameters:
+        ----------
+            key: Cache key
+            default: Value returned when the key is not cached
+
+        Returns:
+        -------
+            Cached value or default
+        """
+        entry = self._data.get(key)
+        if entry is None or not self._is_fresh(entry):
+            return default
+        return entry[0]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key.
+
+        Parameters:
+        ----------
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._data[key] = [value, time.time()]
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it has been modified.
+
+        Stale entries are dropped, so caches keyed by date do not grow
+        without bound.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            self._data = {
+                key: entry
+                for key, entry in self._data.items()
+                if self._is_fresh(entry)
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so a crash mid-write cannot
+            # leave a truncated cache behind
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_bytes(fast_json.dumps(self._data))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
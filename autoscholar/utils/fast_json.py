@@ -0,0 +1,56 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson is a C extension that serializes and parses several times faster
+than the standard library. It is optional: without it these helpers fall
+back to ``json`` and produce equivalent output.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Parameters:
+    ----------
+        obj: Object to serialize
+        indent: Whether to pretty-print with an indentation of two spaces
+
+    Returns:
+    -------
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj, ensure_ascii=False, indent=2 if indent else None
+    ).encode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document.
+
+    Parameters:
+    ----------
+        data: JSON document as text or UTF-8 encoded bytes
+
+    Returns:
+    -------
+        Parsed object
+
+    Raises:
+    ------
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,44 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Status codes that indicate a transient server-side failure
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_session(
+    pool_size: int = 32, retries: int = 5, backoff_factor: float = 0.5
+) -> requests.Session:
+    """Create a requests session with connection pooling and retries.
+
+    Reusing one session keeps connections alive across requests, so the
+    TCP and TLS handshakes are paid once per host instead of per request.
+    Connection errors and transient status codes are retried with
+    exponential backoff, honouring any Retry-After header, so callers only
+    see failures that persist.
+
+    Parameters:
+    ----------
+        pool_size: Number of connections kept alive per host
+        retries: Number of retries on connection errors and transient
+            HTTP status codes
+        backoff_factor: Backoff factor between retries, in seconds
+
+    Returns:
+    -------
+        Configured session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            respect_retry_after_header=True,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
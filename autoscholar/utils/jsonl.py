@@ -0,0 +1,118 @@
+import gzip
+import threading
+from pathlib import Path
+from typing import IO, Any, Dict, Union
+
+from autoscholar.utils import fast_json
+
+# Field holding the record key on each JSON line
+KEY_FIELD = "id"
+# Files with this suffix are gzip-compressed
+GZIP_SUFFIX = ".gz"
+# Fast compression keeps CPU cost below the I/O it saves on repetitive JSON
+GZIP_COMPRESSLEVEL = 1
+
+
+def _open(path: Union[str, Path], mode: str) -> IO[bytes]:
+    """Open a JSON Lines file in binary mode, through gzip for ".gz" paths.
+
+    Appending to a gzip file adds a new gzip member, and readers decompress
+    all members in sequence, so appends work the same as for plain files.
+    """
+    if Path(path).suffix == GZIP_SUFFIX:
+        return gzip.open(path, mode, compresslevel=GZIP_COMPRESSLEVEL)
+    return open(path, mode)
+
+
+def append_records(
+    path: Union[str, Path], records: Dict[str, Dict[str, Any]]
+) -> None:
+    """Append records to a JSON Lines file, one record per line.
+
+    Only the new records are written, so the cost of a save does not grow
+    with the size of the file. Paths ending in ".gz" are gzip-compressed.
+
+    Parameters:
+    ----------
+        path: Path to the JSON Lines file
+        records: Mapping from record key to record data
+    """
+    with _open(path, "ab") as f:
+        for key, record in records.items():
+            f.write(fast_json.dumps({KEY_FIELD: key, **record}) + b"\n")
+
+
+class JsonlWriter:
+    """Thread-safe writer that appends records to a JSON Lines file.
+
+    Each record is flushed as soon as it is written, so nothing needs to be
+    held in memory until the end of a run and a crash only loses the record
+    being written. The file is opened on the first write, so a writer that
+    never receives a record leaves no empty file behind. Paths ending in
+    ".gz" are gzip-compressed.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Initialize the writer.
+
+        Parameters:
+        ----------
+            path: Path to the JSON Lines file
+        """
+        self.path = Path(path)
+        self.count = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    def write(self, key: str, record: Dict[str, Any]) -> None:
+        """Append one record and flush it to disk.
+
+        Parameters:
+        ----------
+            key: Record key
+            record: Record data
+        """
+        line = fast_json.dumps({KEY_FIELD: key, **record}) + b"\n"
+        with self._lock:
+            if self._file is None:
+                self._file = _open(self.path, "ab")
+            self._file.write(line)
+            self._file.flush()
+            self.count += 1
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_records(path: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+    """Load records from a JSON Lines file written by ``append_records``.
+
+    When a key appears on several lines the last one wins, which matches
+    updating a dictionary with each save in turn.
+
+    Parameters:
+    ----------
+        path: Path to the JSON Lines file
+
+    Returns:
+    -------
+        Mapping from record key to record data
+    """
+    records = {}
+    with _open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = fast_json.loads(line)
+            records[record.pop(KEY_FIELD)] = record
+    return records
@@ -4,6 +4,9 @@ import logging
 def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """Set up a logger with the specified name and logging level.
 
+    The console handler is only attached on the first call for a name, so
+    calling this repeatedly does not write every record several times.
+
     Parameters:
     ----------
         name: Name of the logger
@@ -15,6 +18,8 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """
     logger = logging.getLogger(name)
     logger.setLevel(level)
+    if logger.handlers:
+        return logger
 
     # Create console handler and set level
     ch = logging.StreamHandler()
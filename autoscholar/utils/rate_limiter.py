@@ -0,0 +1,49 @@
+import threading
+import time
+from collections import deque
+
+
+class RateLimiter:
+    """Thread-safe limiter allowing ``calls`` acquisitions per ``period``.
+
+    Use it as a context manager around each request; callers block until
+    the request fits in the sliding time window.
+    """
+
+    def __init__(self, calls: int, period: float):
+        """Initialize the rate limiter.
+
+        Parameters:
+        ----------
+            calls: Maximum number of acquisitions within a period
+            period: Length of the sliding window in seconds
+        """
+        if calls < 1 or period <= 0:
+            raise ValueError("calls must be >= 1 and period must be > 0")
+        self.calls = calls
+        self.period = period
+        self._timestamps = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until another call is allowed within the rate limit."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while (
+                    self._timestamps
+                    and now - self._timestamps[0] >= self.period
+                ):
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.calls:
+                    self._timestamps.append(now)
+                    return
+                wait = self.period - (now - self._timestamps[0])
+            time.sleep(wait)
+
+    def __enter__(self) -> "RateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
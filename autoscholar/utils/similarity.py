@@ -1,27 +1,340 @@
 # scholarauto/utils/similarity.py
 
-from typing import Any, Dict, List, Tuple
+import contextlib
+import os
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+
+from autoscholar.utils import _sim_kernel
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:  # pragma: no cover - depends on the environment
+    threadpool_limits = None
+
+
+# Number of rows multiplied at once when computing condensed similarities
+SIMILARITY_BLOCK_SIZE = 1024
+# Target size of one similarity tile, so a B x N tile stays near the size
+# of a last-level cache instead of growing with N^2
+SIMILARITY_TILE_BYTES = 32 * 1024 * 1024
+# Below this threshold most pairs are kept, and the BLAS path is faster
+# than the numba kernel, whose advantage is skipping discarded pairs
+NUMBA_MIN_THRESHOLD = 0.5
+
+
+def blas_threads(limit: Optional[int] = None) -> ContextManager:
+    """Let the BLAS library use all cores inside the returned context.
+
+    BLAS builds may be capped to fewer threads than there are cores, for
+    example through OPENBLAS_NUM_THREADS or by another library. With
+    threadpoolctl installed the limit is raised for the duration of the
+    context; otherwise the context does nothing.
+
+    Parameters:
+    ----------
+        limit: Number of BLAS threads (defaults to the number of CPUs)
+
+    Returns:
+    -------
+        Context manager applying the limit
+    """
+    if threadpool_limits is None:
+        return contextlib.nullcontext()
+    return threadpool_limits(limits=limit or os.cpu_count(), user_api="blas")
+
+
+def _normalize_rows(
+    embeddings: np.ndarray | List[List[float]],
+    dtype: Optional[np.dtype] = None,
+) -> np.ndarray:
+    """L2-normalize the rows of a matrix.
+
+    The result has the given dtype, or the floating dtype of the input when
+    dtype is None (float64 for lists).
+    """
+    embeddings = np.asarray(embeddings)
+    if dtype is None:
+        dtype = embeddings.dtype
+        if not np.issubdtype(dtype, np.floating):
+            dtype = np.float64
+    # Normalize in at least float32 so half-precision norms keep their range.
+    # The working copy is the only allocation; it is divided in place
+    normalized = embeddings.astype(np.promote_types(dtype, np.float32))
+    norms = np.linalg.norm(normalized, axis=1, keepdims=True)
+    # Zero vectors stay zero and get a similarity of 0 with everything
+    np.maximum(norms, 1e-12, out=norms)
+    normalized /= norms
+    return normalized.astype(dtype, copy=False)
 
 
 def compute_similarity_matrix(
     embeddings: np.ndarray | List[List[float]],
+    dtype: Optional[np.dtype] = np.float32,
 ) -> np.ndarray:
     """Compute cosine similarity matrix between all embeddings.
 
+    Rows are L2-normalized once and the matrix is computed as a single
+    ``X @ X.T`` product, which runs as one multi-threaded BLAS call. Text
+    embeddings do not need more than float32 precision, which halves the
+    memory traffic of float64.
+
     Parameters:
     ----------
         embeddings: Matrix of embeddings (n_samples, embedding_dim)
+        dtype: Floating dtype of the computation (None keeps the dtype of
+            the input)
 
     Returns:
     -------
         Similarity matrix (n_samples, n_samples)
     """
-    if isinstance(embeddings, list):
-        embeddings = np.array(embeddings)
-    return cosine_similarity(embeddings)
+    normalized = _normalize_rows(embeddings, dtype)
+    similarity = normalized @ normalized.T
+    np.clip(similarity, -1.0, 1.0, out=similarity)
+    # Every non-zero vector is exactly similar to itself, without the
+    # rounding error of its dot product
+    np.fill_diagonal(similarity, normalized.any(axis=1))
+    return similarity
+
+
+def compute_condensed_similarity(
+    embeddings: np.ndarray | List[List[float]],
+    block_size: int = SIMILARITY_BLOCK_SIZE,
+) -> np.ndarray:
+    """Compute the cosine similarities above the diagonal only.
+
+    The similarity matrix is symmetric with a trivial diagonal, so only
+    the pairs ``i < j`` are computed and stored, in the order of
+    ``np.triu_indices(n, k=1)`` (the condensed form used by scipy's
+    ``pdist``). Rows are multiplied in blocks against the columns to their
+    right, which halves both the memory and the flops of the full matrix.
+
+    Parameters:
+    ----------
+        embeddings: Matrix of embeddings (n_samples, embedding_dim)
+        block_size: Number of rows multiplied at once
+
+    Returns:
+    -------
+        Similarities of all pairs i < j, of length n * (n - 1) / 2
+    """
+    normalized = _normalize_rows(embeddings)
+    n = normalized.shape[0]
+    condensed = np.empty(n * (n - 1) // 2, dtype=normalized.dtype)
+
+    offset = 0
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        block = normalized[start:stop] @ normalized[start:].T
+        for k in range(stop - start):
+            row = block[k, k + 1 :]
+            condensed[offset : offset + row.size] = row
+            offset += row.size
+    return np.clip(condensed, -1.0, 1.0, out=condensed)
+
+
+def _tile_rows(n: int, itemsize: int) -> int:
+    """Choose the number of rows of a tile of ``SIMILARITY_TILE_BYTES``."""
+    return max(1, min(n, SIMILARITY_TILE_BYTES // max(1, n * itemsize)))
+
+
+def iter_similar_pairs(
+    embeddings: np.ndarray | List[List[float]],
+    threshold: float,
+    block_size: Optional[int] = None,
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Yield the pairs i < j above a similarity threshold, one tile at a time.
+
+    Each tile multiplies a block of rows against the columns to their right
+    with BLAS, so peak extra memory is one ``block_size x N`` tile instead
+    of the full N x N matrix.
+
+    Parameters:
+    ----------
+        embeddings: Matrix of embeddings (n_samples, embedding_dim)
+        threshold: Minimum similarity of a returned pair
+        block_size: Number of rows per tile (sized from
+            ``SIMILARITY_TILE_BYTES`` if None)
+
+    Yields:
+    ------
+        Row indices, column indices and similarities of the pairs in a
+        tile, ordered by row and then column
+    """
+    normalized = _normalize_rows(embeddings)
+    n = normalized.shape[0]
+    if block_size is None:
+        block_size = _tile_rows(n, normalized.itemsize)
+    for start in range(0, n, block_size):
+        block = normalized[start : start + block_size] @ normalized[start:].T
+        # Keep only the pairs to the right of the diagonal
+        rows, cols = np.nonzero(np.triu(block >= threshold, k=1))
+        sims = np.minimum(block[rows, cols], 1.0)
+        yield rows + start, cols + start, sims
+
+
+def find_similar_pairs(
+    embeddings: np.ndarray | List[List[float]],
+    threshold: float,
+    block_size: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find all pairs i < j with a cosine similarity of at least threshold.
+
+    With numba installed and a high threshold, a JIT-compiled kernel walks
+    the upper triangle and keeps only the pairs above the threshold.
+    Otherwise the pairs are collected tile by tile from
+    ``iter_similar_pairs``. The similarity matrix is never stored.
+
+    Parameters:
+    ----------
+        embeddings: Matrix of embeddings (n_samples, embedding_dim)
+        threshold: Minimum similarity of a returned pair
+        block_size: Number of rows per tile on the BLAS path
+
+    Returns:
+    -------
+        Row indices, column indices and similarities, ordered by row and
+        then column
+    """
+    normalized = _normalize_rows(embeddings)
+    if _sim_kernel.NUMBA_AVAILABLE and threshold >= NUMBA_MIN_THRESHOLD:
+        return _sim_kernel.threshold_pairs(normalized, threshold)
+
+    tiles = list(iter_similar_pairs(normalized, threshold, block_size))
+    if not tiles:
+        return (
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=normalized.dtype),
+        )
+    rows, cols, sims = zip(*tiles)
+    return np.concatenate(rows), np.concatenate(cols), np.concatenate(sims)
+
+
+def quantize_embeddings(
+    embeddings: np.ndarray | List[List[float]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Quantize embeddings to int8 with one scale per row.
+
+    Each row is scaled so its largest absolute value maps to 127, so every
+    component is off by at most 1/254 of that value, while the matrix takes
+    a quarter of the float32 bytes.
+
+    Parameters:
+    ----------
+        embeddings: Matrix of embeddings (n_samples, embedding_dim)
+
+    Returns:
+    -------
+        Quantized int8 matrix and float32 scales of shape (n_samples, 1)
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    scales = np.max(np.abs(embeddings), axis=1, keepdims=True) / 127.0
+    # All-zero rows keep a scale of 1 and quantize to zeros
+    scales[scales == 0] = 1.0
+    quantized = np.round(embeddings / scales).astype(np.int8)
+    return quantized, scales.astype(np.float32)
+
+
+def dequantize_embeddings(
+    quantized: np.ndarray, scales: np.ndarray
+) -> np.ndarray:
+    """Restore float32 embeddings from ``quantize_embeddings`` output.
+
+    Parameters:
+    ----------
+        quantized: Quantized int8 matrix (n_samples, embedding_dim)
+        scales: Scales of shape (n_samples, 1)
+
+    Returns:
+    -------
+        Approximate float32 embeddings
+    """
+    return quantized.astype(np.float32) * scales
+
+
+class PaperIndex:
+    """Index of paper embeddings for repeated similarity queries.
+
+    The paper embeddings are L2-normalized once when the index is built, so
+    each query costs one normalization of the query vector and a single
+    matrix-vector product. They are stored as float32 by default; float16
+    halves the memory of large, archived paper banks again at the cost of
+    slower queries, as numpy has no BLAS kernels for half precision.
+    """
+
+    def __init__(
+        self,
+        paper_embeddings: np.ndarray | List[List[float]],
+        papers: List[Dict[str, Any]],
+        dtype: Optional[np.dtype] = np.float32,
+    ):
+        """Initialize the index.
+
+        Parameters:
+        ----------
+            paper_embeddings: Matrix of paper embeddings
+            papers: List of paper dictionaries, one per embedding row
+            dtype: Floating dtype of the stored embeddings (None keeps the
+                dtype of the input)
+        """
+        self.normalized = _normalize_rows(paper_embeddings, dtype)
+        self.papers = papers
+
+    def similarities(self, query_embedding: np.ndarray) -> np.ndarray:
+        """Compute the cosine similarity of a query to every paper.
+
+        Parameters:
+        ----------
+            query_embedding: Query embedding vector
+
+        Returns:
+        -------
+            Similarity of the query to each paper
+        """
+        query = _normalize_rows(
+            np.reshape(query_embedding, (1, -1)), self.normalized.dtype
+        )[0]
+        return self.normalized @ query
+
+    def search(
+        self, query_embedding: np.ndarray, top_k: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Find the papers most similar to a query embedding.
+
+        Parameters:
+        ----------
+            query_embedding: Query embedding vector
+            top_k: Number of top results to return
+
+        Returns:
+        -------
+            List of dictionaries with papers and similarity scores
+        """
+        similarities = self.similarities(query_embedding)
+
+        k = min(top_k, similarities.size)
+        if k <= 0:
+            return []
+
+        # Select the top-k papers in linear time and sort only those
+        top_indices = np.argpartition(-similarities, k - 1)[:k]
+        top_indices = top_indices[np.argsort(-similarities[top_indices])]
+
+        return [
+            {"paper": self.papers[idx], "similarity": float(similarities[idx])}
+            for idx in top_indices
+        ]
 
 
 def get_similar_papers(
@@ -29,33 +342,28 @@ def get_similar_papers(
     paper_embeddings: np.ndarray,
     papers: List[Dict[str, Any]],
     top_k: int = 5,
+    dtype: Optional[np.dtype] = np.float32,
 ) -> List[Dict[str, Any]]:
     """Find papers most similar to a query embedding.
 
+    For repeated queries against the same papers, build a ``PaperIndex``
+    once instead, so the paper embeddings are normalized only once.
+
     Parameters:
     ----------
         query_embedding: Query embedding vector
         paper_embeddings: Matrix of paper embeddings
         papers: List of paper dictionaries
         top_k: Number of top results to return
+        dtype: Floating dtype of the computation (None keeps the dtype of
+            the input)
 
     Returns:
     -------
         List of dictionaries with papers and similarity scores
     """
-    # Compute similarity between query and all papers
-    similarities = cosine_similarity([query_embedding], paper_embeddings)[0]
-
-    # Get indices of top-k papers
-    top_indices = similarities.argsort()[-top_k:][::-1]
-
-    # Create result list
-    results = []
-    for idx in top_indices:
-        result = {"paper": papers[idx], "similarity": float(similarities[idx])}
-        results.append(result)
-
-    return results
+    index = PaperIndex(paper_embeddings, papers, dtype)
+    return index.search(query_embedding, top_k)
 
 
 def filter_connections_by_threshold(
@@ -72,16 +380,55 @@ def filter_connections_by_threshold(
     -------
         List of tuples (node_i, node_j, similarity)
     """
-    connections = []
+    similarity_matrix = np.asarray(similarity_matrix)
     n = similarity_matrix.shape[0]
+    rows, cols, sims = [], [], []
+    # Scan the upper triangle in blocks of rows, so no index arrays or
+    # masks of the full matrix are materialized
+    for start in range(0, n, SIMILARITY_BLOCK_SIZE):
+        block = similarity_matrix[start : start + SIMILARITY_BLOCK_SIZE, start:]
+        block_rows, block_cols = np.nonzero(np.triu(block >= threshold, k=1))
+        rows.append(block_rows + start)
+        cols.append(block_cols + start)
+        sims.append(block[block_rows, block_cols])
+    if not rows:
+        return []
+    return _sorted_connections(*(np.concatenate(x) for x in (rows, cols, sims)))
 
-    for i in range(n):
-        for j in range(i + 1, n):  # Upper triangular to avoid duplicates
-            similarity = similarity_matrix[i, j]
-            if similarity >= threshold:
-                connections.append((i, j, similarity))
 
-    # Sort by similarity (strongest connections first)
-    connections.sort(key=lambda x: x[2], reverse=True)
+def streaming_filter_connections(
+    embeddings: np.ndarray | List[List[float]],
+    threshold: float = 0.5,
+    block_size: Optional[int] = None,
+) -> List[Tuple[int, int, float]]:
+    """Find the connections above a threshold directly from embeddings.
+
+    Equivalent to ``filter_connections_by_threshold`` applied to
+    ``compute_similarity_matrix(embeddings)``, but the pairs come from
+    ``find_similar_pairs``, so the N x N matrix is never stored and peak
+    memory stays at one tile of ``block_size x N`` similarities.
+
+    Parameters:
+    ----------
+        embeddings: Matrix of embeddings (n_samples, embedding_dim)
+        threshold: Minimum similarity to include connection
+        block_size: Number of rows per tile on the BLAS path
 
-    return connections
+    Returns:
+    -------
+        List of tuples (node_i, node_j, similarity)
+    """
+    return _sorted_connections(
+        *find_similar_pairs(embeddings, threshold, block_size)
+    )
+
+
+def _sorted_connections(
+    rows: np.ndarray, cols: np.ndarray, sims: np.ndarray
+) -> List[Tuple[int, int, float]]:
+    """Convert pairs to connection tuples, strongest connections first."""
+    # The stable sort keeps ties in row-major order
+    order = np.argsort(-sims, kind="stable")
+    return list(
+        zip(rows[order].tolist(), cols[order].tolist(), sims[order].tolist())
+    )
@@ -1,15 +1,34 @@
+import functools
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 
-from pyvis.network import Network
+if TYPE_CHECKING:
+    from ..knowledge.knowledge_graph import KnowledgeGraph
 
-from ..knowledge.knowledge_graph import KnowledgeGraph
+_DEFAULT_COLOR = {"background": "#97C2FC", "border": "#2B7CE9"}
+
+
+@functools.lru_cache(maxsize=256)
+def _color_for_year(year: int) -> Dict[str, str]:
+    """Return the node color of a publication year.
+
+    Colors form a gradient from light blue (older) to dark blue (newer).
+    The result is cached and shared, so it must not be modified.
+    """
+    if year < 2010:
+        return {"background": "#D2E5FF", "border": "#2B7CE9"}
+    elif year < 2015:
+        return {"background": "#AED6F1", "border": "#2B7CE9"}
+    elif year < 2020:
+        return {"background": "#5DADE2", "border": "#2B7CE9"}
+    else:
+        return {"background": "#2E86C1", "border": "#2B7CE9"}
 
 
 class GraphVisualizer:
     """Visualize knowledge graphs with interactive features."""
 
-    def __init__(self, knowledge_graph: KnowledgeGraph):
+    def __init__(self, knowledge_graph: "KnowledgeGraph"):
         """Initialize the visualizer with a knowledge graph.
 
         Parameters:
@@ -18,6 +37,9 @@ class GraphVisualizer:
         self.kg = knowledge_graph
         self.graph = knowledge_graph.graph
         self.papers = knowledge_graph.papers
+        self._metadata: Optional[Dict[str, Tuple[str, str, Dict[str, str]]]] = (
+            None
+        )
 
     def visualize_pyvis(
         self,
@@ -37,6 +59,10 @@ class GraphVisualizer:
         Returns:
             Path to the saved HTML file
         """
+        # pyvis pulls in jinja2 and its templates, so it is only imported
+        # when a visualization is actually rendered
+        from pyvis.network import Network
+
         # Create Pyvis network
         net = Network(height, width, notebook=False, directed=False)
 
@@ -48,17 +74,17 @@ class GraphVisualizer:
                 gravity=-80000, central_gravity=0.3, spring_length=250
             )
 
-        # Create paper lookup for quick access
-        paper_lookup = {paper.paper_id: paper for paper in self.papers}
+        # Label, tooltip and color of each paper, computed once per visualizer
+        paper_lookup = self._paper_metadata()
 
         # Store node mapping between graph node IDs and paper IDs
         node_mapping = {}
 
-        # First, add all nodes to ensure they exist before adding edges
-        for node_id in self.graph.nodes():
-            # Get node attributes
-            node_data = self.graph.nodes[node_id]
+        # Nodes are collected first and added to the network in one
+        # add_nodes call
+        nodes = {}
 
+        for node_id, node_data in self.graph.nodes(data=True):
             # Check if paper_id exists in the node data
             paper_id = node_data.get("paper_id")
 
@@ -74,41 +100,40 @@ class GraphVisualizer:
                     )
                     continue
 
-            # Store mapping
-            node_mapping[node_id] = paper_id
-
-            # Get the paper
-            paper = paper_lookup.get(paper_id)
+            metadata = paper_lookup.get(paper_id)
 
-            if not paper:
+            if not metadata:
                 print(f"Warning: Paper not found for ID {paper_id}")
                 continue
 
-            # Get paper metadata
-            title = paper.title
-            authors = paper.meta_info.get("authors", [])
-            first_author = authors[0] if authors else "Unknown"
-            year = paper.meta_info.get("year", "")
-            citations = paper.meta_info.get("citation_count", 10)
-
-            # Create label (shortened title)
-            label = f"{title[:40]}..." if len(title) > 40 else title
+            # Store mapping
+            node_mapping[node_id] = paper_id
 
-            # Create tooltip with more details
-            tooltip = f"<b>{title}</b><br>{first_author} et al., {year}"
+            if paper_id in nodes:
+                continue
 
-            # Get node color
-            color = self._get_node_color(paper)
+            label, tooltip, color = metadata
 
             # Use paper_id as node id in the visualization
-            net.add_node(
-                paper_id, label=label, title=tooltip, size=30, color=color
+            nodes[paper_id] = (label, tooltip, color)
+
+        if nodes:
+            labels, tooltips, colors = zip(*nodes.values())
+            net.add_nodes(
+                list(nodes),
+                label=list(labels),
+                title=list(tooltips),
+                size=[30] * len(nodes),
+                color=list(colors),
             )
 
-        # Add edges with weights, using the mapped node IDs
-        for edge in self.graph.edges(data=True):
-            source, target, data = edge
+        # Edge styling is shared by every edge
+        edge_font = {"size": 10, "color": "#555555", "align": "middle"}
+        # Curved edges for better visibility
+        edge_smooth = {"type": "curvedCW", "roundness": 0.2}
 
+        # Add edges with weights, using the mapped node IDs
+        for source, target, data in self.graph.edges(data=True):
             # Map source and target to paper_ids
             source_paper_id = node_mapping.get(source)
             target_paper_id = node_mapping.get(target)
@@ -122,21 +147,16 @@ class GraphVisualizer:
 
             similarity = data.get("weight", 0.5)
 
-            # Format similarity for display with percentage
-            similarity_label = f"{similarity:.0%}"
-
             net.add_edge(
                 source_paper_id,
                 target_paper_id,
                 value=similarity,
                 width=similarity * 5,  # Scale for visualization
                 title=f"Similarity: {similarity:.2f}",
-                label=similarity_label,  # Add label to show similarity on the edge
-                font={"size": 10, "color": "#555555", "align": "middle"},
-                smooth={
-                    "type": "curvedCW",
-                    "roundness": 0.2,
-                },  # Curved edges for better visibility
+                # Show the similarity as a percentage on the edge
+                label=f"{similarity:.0%}",
+                font=edge_font,
+                smooth=edge_smooth,
             )
 
         # Save to HTML file
@@ -144,6 +164,37 @@ class GraphVisualizer:
         net.show(output_path)
         return output_path
 
+    def _paper_metadata(self) -> Dict[str, Tuple[str, str, Dict[str, str]]]:
+        """Build the label, tooltip and color of every paper.
+
+        The result is cached, so metadata lookups and color computation
+        happen once per paper even when the graph is visualized repeatedly.
+
+        Returns:
+            Dictionary mapping paper IDs to (label, tooltip, color) tuples
+        """
+        if self._metadata is None:
+            metadata = {}
+            for paper in self.papers:
+                title = paper.title
+                meta_info = paper.meta_info
+                authors = meta_info.get("authors", [])
+                first_author = authors[0] if authors else "Unknown"
+                year = meta_info.get("year", "")
+
+                # Create label (shortened title)
+                label = f"{title[:40]}..." if len(title) > 40 else title
+                # Create tooltip with more details
+                tooltip = f"<b>{title}</b><br>{first_author} et al., {year}"
+
+                metadata[paper.paper_id] = (
+                    label,
+                    tooltip,
+                    self._get_node_color(paper),
+                )
+            self._metadata = metadata
+        return self._metadata
+
     def _get_node_color(self, paper):
         """Determine node color based on paper properties.
 
@@ -156,18 +207,10 @@ class GraphVisualizer:
         year = paper.meta_info.get("year", 0)
 
         if not year:
-            return {"background": "#97C2FC", "border": "#2B7CE9"}
+            return _DEFAULT_COLOR
 
         try:
             year = int(year)
-            # Color gradient from light blue (older) to dark blue (newer)
-            if year < 2010:
-                return {"background": "#D2E5FF", "border": "#2B7CE9"}
-            elif year < 2015:
-                return {"background": "#AED6F1", "border": "#2B7CE9"}
-            elif year < 2020:
-                return {"background": "#5DADE2", "border": "#2B7CE9"}
-            else:
-                return {"background": "#2E86C1", "border": "#2B7CE9"}
-        except:
-            return {"background": "#97C2FC", "border": "#2B7CE9"}
+        except (TypeError, ValueError, OverflowError):
+            return _DEFAULT_COLOR
+        return _color_for_year(year)
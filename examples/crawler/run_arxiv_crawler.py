@@ -1,12 +1,12 @@
 from pathlib import Path
-import yaml
 from autoscholar.crawler.arxiv_crawler import ArxivCrawler
 
+CONFIG_PATH = (Path(__file__).parent / "config_sample.yaml").resolve()
+
 
 def main():
     """Run the arXiv crawler using configuration from config_sample.yaml."""
-    config_path = Path(__file__).parent / "config_sample.yaml"
-    crawler = ArxivCrawler.from_config_file(config_path)
+    crawler = ArxivCrawler.from_config_file(CONFIG_PATH)
     crawler.run()
 
 
@@ -1,12 +1,12 @@
 from pathlib import Path
-import yaml
 from autoscholar.crawler.github_crawler import GithubCrawler
 
+CONFIG_PATH = (Path(__file__).parent / "config_sample.yaml").resolve()
+
 
 def main():
     """Run the GitHub crawler using configuration from config_sample.yaml."""
-    config_path = Path(__file__).parent / "config_sample.yaml"
-    crawler = GithubCrawler.from_config_file(config_path)
+    crawler = GithubCrawler.from_config_file(CONFIG_PATH)
     crawler.run()
 
 
@@ -1,15 +1,61 @@
-import json
 import os
 from pathlib import Path
 
+import numpy as np
 from camel.embeddings import OpenAIEmbedding
 from camel.types import EmbeddingModelType
 
+from autoscholar.embeddings import BatchedEmbedding
 from autoscholar.knowledge import KnowledgeGraphBuilder, Paper
+from autoscholar.utils import fast_json
 from autoscholar.visualization.graph_visualizer import GraphVisualizer
 
 EMBEDDING_PATH = Path("examples/kg_by_abstract/example-data/embeddings")
 PAPER_JSON_PATH = Path("examples/kg_by_abstract/example-data")
+EMBEDDING_MATRIX_FILE = EMBEDDING_PATH / "embeddings.npy"
+EMBEDDING_IDS_FILE = EMBEDDING_PATH / "ids.json"
+EMBEDDING_JSON_FILE = EMBEDDING_PATH / "embeddings.json"
+
+
+def load_embeddings(papers):
+    """Load the embeddings of the papers, or return None if none are saved.
+
+    The float32 matrix in embeddings.npy is memory-mapped, so only the rows
+    of the loaded papers are read. The older embeddings.json format is
+    still read when no matrix has been saved.
+    """
+    if EMBEDDING_MATRIX_FILE.exists():
+        print(f"Loading embeddings from {EMBEDDING_MATRIX_FILE}")
+        matrix = np.load(EMBEDDING_MATRIX_FILE, mmap_mode="r")
+        ids = fast_json.loads(EMBEDDING_IDS_FILE.read_bytes())
+        row_of = {paper_id: row for row, paper_id in enumerate(ids)}
+        return {
+            paper.paper_id: matrix[row_of[paper.paper_id]] for paper in papers
+        }
+
+    if EMBEDDING_JSON_FILE.exists():
+        print(f"Loading embeddings from {EMBEDDING_JSON_FILE}")
+        # Parse with orjson when available and keep only the embeddings of
+        # the loaded papers
+        full_embedding_dict = fast_json.loads(EMBEDDING_JSON_FILE.read_bytes())
+        return {
+            paper.paper_id: full_embedding_dict[paper.paper_id]
+            for paper in papers
+        }
+
+    return None
+
+
+def save_embeddings(embedding_dict):
+    """Save embeddings as a float32 matrix plus the paper ID of each row."""
+    os.makedirs(EMBEDDING_PATH, exist_ok=True)
+    ids = list(embedding_dict)
+    matrix = np.asarray(
+        [embedding_dict[paper_id] for paper_id in ids], dtype=np.float32
+    )
+    np.save(EMBEDDING_MATRIX_FILE, matrix)
+    EMBEDDING_IDS_FILE.write_bytes(fast_json.dumps(ids))
+    print(f"Embeddings saved to {EMBEDDING_MATRIX_FILE}")
 
 
 def main():
@@ -18,40 +64,27 @@ def main():
     papers = Paper.load_paper_from_paths(json_paths)
     print(papers, len(papers))
 
-    embedding_dict = {}
-    embedding_file = EMBEDDING_PATH / "embeddings.json"
-
-    # Check if the embedding file exists
-    if os.path.exists(embedding_file):
-        print(f"Loading embeddings from {embedding_file}")
-        with open(embedding_file, "r") as f:
-            full_embedding_dict = json.load(f)
-        embedding_dict = {
-            paper.paper_id: full_embedding_dict[paper.paper_id]
-            for paper in papers
-        }
-    else:
+    embedding_dict = load_embeddings(papers)
+    if embedding_dict is None:
         print(
             f"Embedding file not found. Generating embeddings using OpenAI..."
         )
-        # Create OpenAI embedding model
-        openai_embedding = OpenAIEmbedding(
-            model_type=EmbeddingModelType.TEXT_EMBEDDING_3_SMALL
+        # Create OpenAI embedding model; BatchedEmbedding sends the texts
+        # in as few requests as the API allows
+        openai_embedding = BatchedEmbedding(
+            OpenAIEmbedding(
+                model_type=EmbeddingModelType.TEXT_EMBEDDING_3_SMALL
+            )
         )
 
-        # Generate embeddings for each paper
-        for paper in papers:
-            text = paper.get_text_for_embedding()
-            embedding = openai_embedding.embed(text)
-            embedding_dict[paper.paper_id] = embedding
-
-        # Ensure embeddings directory exists
-        os.makedirs(EMBEDDING_PATH, exist_ok=True)
-
-        # Save embeddings to file
-        with open(embedding_file, "w") as f:
-            json.dump(embedding_dict, f)
-        print(f"Embeddings saved to {embedding_file}")
+        # Generate embeddings for all papers at once
+        texts = [paper.get_text_for_embedding() for paper in papers]
+        embeddings = openai_embedding.embed_list(texts)
+        embedding_dict = {
+            paper.paper_id: embedding
+            for paper, embedding in zip(papers, embeddings)
+        }
+        save_embeddings(embedding_dict)
 
     builder = KnowledgeGraphBuilder()
     knowledge_graph = builder.build_graph(
@@ -6,8 +6,15 @@ import yaml
 import logging
 import argparse
 import datetime
+import functools
 import requests
+from concurrent.futures import ThreadPoolExecutor
 
+from autoscholar.utils import fast_json
+from autoscholar.utils.http import create_session
+
+# The libyaml-backed loader parses several times faster when available
+YAML_LOADER = getattr(yaml, "CFullLoader", yaml.FullLoader)
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +28,83 @@ BASE_URL = "https://arxiv.paperswithcode.com/api/v0/papers/"
 GITHUB_URL = "https://api.github.com/search/repositories"
 ARXIV_URL = "http://arxiv.org/"
 
+# Row templates for the paper list. %-formatting a fixed template is the
+# cheapest way to build a row on CPython.
+ROW_WITH_CODE = "|**%s**|**%s**|%s et.al.|[%s](%s)|**[link](%s)**|%s|%s|\n"
+ROW_WITHOUT_CODE = "|**%s**|**%s**|%s et.al.|[%s](%s)|null|%s|%s|\n"
+WEB_ROW_WITH_CODE = (
+    "- %s, **%s**, %s et.al., Paper: [%s](%s), Code: **[%s](%s)**, "
+    "Comment:%s, Summary: %s\n"
+)
+WEB_ROW_WITHOUT_CODE = (
+    "- %s, **%s**, %s et.al., Paper: [%s](%s), Comment: %s, Abstract: %s\n"
+)
+PLAIN_ROW = "|%s|%s|%s|%s|%s|%s|%s|\n"
+
+# Seconds to wait for the server before giving up on a request
+REQUEST_TIMEOUT = 30
+# Repository URLs found by earlier runs, keyed by arXiv ID without version
+REPO_URL_CACHE_FILE = os.path.join(".cache", "repo_urls.json")
+
+# Largest page of results the arXiv API serves
+ARXIV_MAX_PAGE_SIZE = 2000
+# Maximum number of concurrent paperswithcode lookups
+MAX_WORKERS = 16
+# Maximum number of concurrent PDF downloads
+DOWNLOAD_WORKERS = 8
+# PDFs are streamed to disk in chunks of this size (bytes)
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+
+# Shared by every HTTP call in this script
+session = create_session()
+
+
+def load_json_file(filename: str) -> dict:
+    """Load a JSON file, using orjson when it is installed.
+
+    Parameters:
+    ----------
+    filename : str
+        Path to the JSON file.
+
+    Returns:
+    -------
+    dict
+        Parsed data, or an empty dictionary if the file is missing or empty.
+    """
+    try:
+        with open(filename, "rb") as f:
+            content = f.read()
+    except FileNotFoundError:
+        return {}
+    if not content.strip():
+        return {}
+    return fast_json.loads(content)
+
+
+def save_json_file(filename: str, data: dict):
+    """Write data to a JSON file.
+
+    The paper lists are committed to the repository, so they are written
+    exactly as ``json.dump`` always wrote them (ASCII-escaped, default
+    separators) and only changed entries show up in their diffs. The data
+    is written to a temporary file that then replaces the target, so an
+    interrupted run never leaves a truncated file behind.
+
+    Parameters:
+    ----------
+    filename : str
+        Path to the JSON file.
+    data : dict
+        Data to write.
+    """
+    content = json.dumps(data).encode("ascii")
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, "wb") as f:
+        f.write(content)
+    os.replace(tmp_filename, filename)
+
 
 def load_config(config_file: str) -> dict:
     """Load configuration from a YAML file.
@@ -83,31 +167,30 @@ def load_config(config_file: str) -> dict:
         return keywords
 
     with open(config_file, "r") as f:
-        config = yaml.load(f, Loader=yaml.FullLoader)
+        config = yaml.load(f, Loader=YAML_LOADER)
         config["kv"] = pretty_filters(**config)
         logging.info(f"config = {config}")
     return config
 
 
-def get_authors(authors, partial_author: bool = False) -> str:
-    """Retrieve a formatted string of authors.
+def strip_version(paper_id: str) -> str:
+    """Remove the version from an arXiv ID (e.g., 2108.09112v1 -> 2108.09112).
+
+    Only a trailing "v<digits>" is removed, so old-style IDs whose archive
+    name contains a "v" (e.g., solv-int/9901001v1) keep their prefix.
 
     Parameters:
     ----------
-    authors : list
-        List of author names.
-    partial_author : bool, optional
-        If True, return only the first three authors.
+    paper_id : str
+        arXiv ID, with or without version.
 
     Returns:
     -------
     str
-        String of author names.
+        arXiv ID without version.
     """
-    if not partial_author:
-        return ", ".join(str(author) for author in authors)
-    else:
-        return ", ".join(str(author) for author in authors[:3])
+    key, sep, version = paper_id.rpartition("v")
+    return key if sep and version.isdigit() else paper_id
 
 
 def sort_papers(papers: dict) -> dict:
@@ -146,7 +229,7 @@ def get_code_link(qword: str) -> str:
     """
     query = f"{qword}"
     params = {"q": query, "sort": "stars", "order": "desc"}
-    r = requests.get(GITHUB_URL, params=params)
+    r = session.get(GITHUB_URL, params=params, timeout=REQUEST_TIMEOUT)
     results = r.json()
     code_link = None
     if results["total_count"] > 0:
@@ -154,11 +237,102 @@ def get_code_link(qword: str) -> str:
     return code_link
 
 
-def get_daily_papers(topic: str, query="quantitative finance", max_results=2):
+@functools.lru_cache(maxsize=None)
+def get_arxiv_client(page_size: int) -> arxiv.Client:
+    """Get a shared arXiv client that fetches pages of the given size.
+
+    Parameters:
+    ----------
+    page_size : int
+        Number of results requested per page.
+
+    Returns:
+    -------
+    arxiv.Client
+        Client reused by every search with the same page size.
+    """
+    return arxiv.Client(page_size=page_size, delay_seconds=3, num_retries=5)
+
+
+# Populated from REPO_URL_CACHE_FILE by demo(). Only found repositories are
+# cached, so papers without code are looked up again on later runs.
+repo_url_cache = {}
+
+
+def get_repo_url(paper_id: str) -> str:
+    """Retrieve the official code repository URL of an arXiv paper.
+
+    URLs found earlier are served from ``repo_url_cache`` without a request.
+
+    Parameters:
+    ----------
+    paper_id : str
+        arXiv ID of the paper.
+
+    Returns:
+    -------
+    str
+        Repository URL if found; otherwise, None.
+    """
+    cache_key = strip_version(paper_id)
+    if cache_key in repo_url_cache:
+        return repo_url_cache[cache_key]
+
+    code_url = BASE_URL + paper_id  # API endpoint for code link
+    try:
+        r = session.get(code_url, timeout=REQUEST_TIMEOUT).json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        # Only raised once the session's retries are exhausted
+        logging.error(f"Exception: {e} with id: {paper_id}")
+        return None
+    if "official" in r and r["official"]:
+        repo_url = r["official"]["url"]
+        if repo_url is not None:
+            repo_url_cache[cache_key] = repo_url
+        return repo_url
+    return None
+
+
+def download_pdf(pdf_url: str, pdf_filename: str) -> None:
+    """Download a PDF file, streaming it to disk.
+
+    The PDF is written to a temporary file that only replaces
+    ``pdf_filename`` once the download is complete, so a failed download
+    never leaves a truncated PDF behind.
+
+    Parameters:
+    ----------
+    pdf_url : str
+        URL of the PDF file.
+    pdf_filename : str
+        Path the PDF file is written to.
+    """
+    part_filename = pdf_filename + ".part"
+    try:
+        with session.get(pdf_url, stream=True, timeout=REQUEST_TIMEOUT) as r:
+            r.raise_for_status()
+            with open(part_filename, "wb") as pdf_file:
+                for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    pdf_file.write(chunk)
+        os.replace(part_filename, pdf_filename)
+        logging.info(f"Downloaded PDF to {pdf_filename}")
+    except (requests.exceptions.RequestException, OSError) as e:
+        logging.error(f"Exception: {e} downloading {pdf_url}")
+        try:
+            os.remove(part_filename)
+        except FileNotFoundError:
+            pass
+
+
+def get_daily_papers(
+    topic: str, query="quantitative finance", max_results=2, existing=None
+):
     """Retrieve daily papers based on a topic and search query.
 
     Downloads the PDF for each paper and attempts to retrieve
-    the corresponding code repository URL.
+    the corresponding code repository URL. Papers already listed under the
+    topic with a code link are skipped, since nothing about them would
+    change.
 
     Parameters:
     ----------
@@ -168,38 +342,60 @@ def get_daily_papers(topic: str, query="quantitative finance", max_results=2):
         Search query for papers.
     max_results : int, optional
         Maximum number of papers to retrieve.
+    existing : dict, optional
+        Rows already in the paper list for this topic, keyed by arXiv ID.
 
     Returns:
     -------
     tuple
         Two dictionaries; one for standard content and one for web content.
     """
+    existing = existing or {}
+
     # Create folder structure based on current month and topic
     today_month = datetime.date.today().strftime("%Y-%m")
     folder_path = os.path.join(os.getcwd(), "papers", today_month)
-    if not os.path.exists(folder_path):
-        os.makedirs(folder_path)
-
     query_folder_path = os.path.join(folder_path, topic)
-    if not os.path.exists(query_folder_path):
-        os.makedirs(query_folder_path)
+    os.makedirs(query_folder_path, exist_ok=True)
 
     content = dict()
     content_to_web = dict()
+    download_queue = []
     search_engine = arxiv.Search(
         query=query,
         max_results=max_results,
         sort_by=arxiv.SortCriterion.SubmittedDate,
     )
 
-    for result in search_engine.results():
+    # One page covers the whole query, so no inter-page delay is paid
+    page_size = max(1, min(max_results, ARXIV_MAX_PAGE_SIZE))
+    results = []
+    for result in get_arxiv_client(page_size).results(search_engine):
+        row = existing.get(strip_version(result.get_short_id()))
+        if row is not None and "|null|" not in row:
+            continue
+        results.append(result)
+    if existing:
+        logging.info(f"{len(results)} papers to fetch for {topic}")
+
+    # The code lookups are independent round-trips, so issue them
+    # concurrently instead of waiting on each one inside the loop below
+    paper_ids = [result.get_short_id() for result in results]
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_WORKERS, len(paper_ids)))
+    ) as executor:
+        repo_urls = dict(zip(paper_ids, executor.map(get_repo_url, paper_ids)))
+
+    for result in results:
         paper_id = result.get_short_id()
         paper_title = result.title
         paper_url = result.entry_id
-        code_url = BASE_URL + paper_id  # API endpoint for code link
         paper_abstract = result.summary.replace("\n", " ")
-        paper_authors = get_authors(result.authors)
-        paper_first_author = get_authors(result.authors, partial_author=True)
+        # Only the first three authors are listed, so only they are
+        # stringified
+        paper_first_author = ", ".join(
+            str(author) for author in result.authors[:3]
+        )
         primary_category = result.primary_category
         publish_time = result.published.date()
         update_time = result.updated.date()
@@ -214,89 +410,71 @@ def get_daily_papers(topic: str, query="quantitative finance", max_results=2):
             f"Time = {update_time} title = {paper_title} author = {paper_first_author}"
         )
 
-        # Remove version from arXiv ID (e.g., 2108.09112v1 -> 2108.09112)
-        ver_pos = paper_id.find("v")
-        if ver_pos == -1:
-            paper_key = paper_id
-        else:
-            paper_key = paper_id[0:ver_pos]
+        paper_key = strip_version(paper_id)
         paper_url = ARXIV_URL + "abs/" + paper_key
 
-        # Download the PDF file
-        pdf_url = result.pdf_url
-        pdf_response = requests.get(pdf_url)
+        # Queue the PDF file; downloads run concurrently after this loop
         pdf_filename = os.path.join(query_folder_path, f"{paper_key}.pdf")
-        with open(pdf_filename, "wb") as pdf_file:
-            pdf_file.write(pdf_response.content)
-        logging.info(f"Downloaded PDF for {paper_title} to {pdf_filename}")
+        download_queue.append((result.pdf_url, pdf_filename))
 
         paper_summary = paper_abstract
 
-        try:
-            # Retrieve repository link from the code API
-            r = requests.get(code_url).json()
-            repo_url = None
-            if "official" in r and r["official"]:
-                repo_url = r["official"]["url"]
-            # TODO: If repository URL is not found, attempt additional queries
-            if repo_url is not None:
-                content[paper_key] = (
-                    "|**{}**|**{}**|{} et.al.|[{}]({})|**[link]({})**|{}|{}|\n".format(
-                        update_time,
-                        paper_title,
-                        paper_first_author,
-                        paper_key,
-                        paper_url,
-                        repo_url,
-                        comments,
-                        paper_summary,
-                    )
-                )
-                content_to_web[paper_key] = (
-                    "- {}, **{}**, {} et.al., Paper: [{}]({}), Code: **[{}]({})**, Comment:{}, Summary: {}\n".format(
-                        update_time,
-                        paper_title,
-                        paper_first_author,
-                        paper_url,
-                        paper_url,
-                        repo_url,
-                        repo_url,
-                        comments,
-                        paper_summary,
-                    )
-                )
-            else:
-                content[paper_key] = (
-                    "|**{}**|**{}**|{} et.al.|[{}]({})|null|{}|{}|\n".format(
-                        update_time,
-                        paper_title,
-                        paper_first_author,
-                        paper_key,
-                        paper_url,
-                        comments,
-                        paper_summary,
-                    )
-                )
-                content_to_web[paper_key] = (
-                    "- {}, **{}**, {} et.al., Paper: [{}]({}), Comment: {}, Abstract: {}\n".format(
-                        update_time,
-                        paper_title,
-                        paper_first_author,
-                        paper_url,
-                        paper_url,
-                        comments,
-                        paper_summary,
-                    )
-                )
+        repo_url = repo_urls[paper_id]
+        # TODO: If repository URL is not found, attempt additional queries
+        if repo_url is not None:
+            content[paper_key] = ROW_WITH_CODE % (
+                update_time,
+                paper_title,
+                paper_first_author,
+                paper_key,
+                paper_url,
+                repo_url,
+                comments,
+                paper_summary,
+            )
+            content_to_web[paper_key] = WEB_ROW_WITH_CODE % (
+                update_time,
+                paper_title,
+                paper_first_author,
+                paper_url,
+                paper_url,
+                repo_url,
+                repo_url,
+                comments,
+                paper_summary,
+            )
+        else:
+            content[paper_key] = ROW_WITHOUT_CODE % (
+                update_time,
+                paper_title,
+                paper_first_author,
+                paper_key,
+                paper_url,
+                comments,
+                paper_summary,
+            )
+            content_to_web[paper_key] = WEB_ROW_WITHOUT_CODE % (
+                update_time,
+                paper_title,
+                paper_first_author,
+                paper_url,
+                paper_url,
+                comments,
+                paper_summary,
+            )
 
-            # Append comments if available (currently not used)
-            if comments is not None:
-                content_to_web[paper_key] += f", {comments}\n"
-            else:
-                content_to_web[paper_key] += "\n"
+        # Append comments if available (currently not used)
+        if comments is not None:
+            content_to_web[paper_key] += f", {comments}\n"
+        else:
+            content_to_web[paper_key] += "\n"
 
-        except Exception as e:
-            logging.error(f"Exception: {e} with id: {paper_key}")
+    if download_queue:
+        with ThreadPoolExecutor(
+            max_workers=min(DOWNLOAD_WORKERS, len(download_queue))
+        ) as executor:
+            pdf_urls, pdf_filenames = zip(*download_queue)
+            list(executor.map(download_pdf, pdf_urls, pdf_filenames))
 
     data = {topic: content}
     data_web = {topic: content_to_web}
@@ -336,14 +514,8 @@ def update_paper_links(filename: str):
         arxiv_id = re.sub(r"v\d+", "", arxiv_id)
         return date, title, authors, arxiv_id, code, comment, summary
 
-    with open(filename, "r") as f:
-        content = f.read()
-        if not content:
-            m = {}
-        else:
-            m = json.loads(content)
-
-    json_data = m.copy()
+    json_data = load_json_file(filename)
+    pending = []
 
     for keywords, v in json_data.items():
         logging.info(f"keywords = {keywords}")
@@ -358,7 +530,7 @@ def update_paper_links(filename: str):
                 paper_comment,
                 paper_summary,
             ) = parse_arxiv_string(contents)
-            contents = "|{}|{}|{}|{}|{}|{}|{}|\n".format(
+            contents = PLAIN_ROW % (
                 update_time,
                 paper_title,
                 paper_first_author,
@@ -371,25 +543,29 @@ def update_paper_links(filename: str):
             logging.info(f"paper_id = {paper_id}, contents = {contents}")
 
             valid_link = False if "|null|" in contents else True
-            if valid_link:
-                continue
-            try:
-                code_url = BASE_URL + paper_id  # API endpoint for code link
-                r = requests.get(code_url).json()
-                repo_url = None
-                if "official" in r and r["official"]:
-                    repo_url = r["official"]["url"]
-                    if repo_url is not None:
-                        new_cont = contents.replace(
-                            "|null|", f"|**[link]({repo_url})**|"
-                        )
-                        logging.info(f"ID = {paper_id}, contents = {new_cont}")
-                        json_data[keywords][paper_id] = str(new_cont)
-            except Exception as e:
-                logging.error(f"Exception: {e} with id: {paper_id}")
+            if not valid_link:
+                pending.append((keywords, paper_id, contents))
+
+    # Resolve all missing links in one concurrent pass
+    paper_ids = list({paper_id for _, paper_id, _ in pending})
+    if paper_ids:
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_WORKERS, len(paper_ids))
+        ) as executor:
+            repo_urls = dict(
+                zip(paper_ids, executor.map(get_repo_url, paper_ids))
+            )
+        for keywords, paper_id, contents in pending:
+            repo_url = repo_urls[paper_id]
+            if repo_url is not None:
+                new_cont = contents.replace(
+                    "|null|", f"|**[link]({repo_url})**|"
+                )
+                logging.info(f"ID = {paper_id}, contents = {new_cont}")
+                json_data[keywords][paper_id] = str(new_cont)
+
     # Write updated data back to the JSON file
-    with open(filename, "w") as f:
-        json.dump(json_data, f)
+    save_json_file(filename, json_data)
 
 
 def update_json_file(filename: str, data_dict):
@@ -402,18 +578,7 @@ def update_json_file(filename: str, data_dict):
     data_dict : list
         List of dictionaries containing new paper data.
     """
-    if not os.path.exists(filename):
-        with open(filename, "w") as f:
-            f.write("{}")
-
-    with open(filename, "r") as f:
-        content = f.read()
-        if not content:
-            m = {}
-        else:
-            m = json.loads(content)
-
-    json_data = m.copy()
+    json_data = load_json_file(filename)
 
     # Update papers for each keyword
     for data in data_dict:
@@ -424,8 +589,7 @@ def update_json_file(filename: str, data_dict):
             else:
                 json_data[keyword] = papers
 
-    with open(filename, "w") as f:
-        json.dump(json_data, f)
+    save_json_file(filename, json_data)
 
 
 def json_to_md(
@@ -574,12 +738,7 @@ def json_to_md(
     DateNow = str(DateNow)
     DateNow = DateNow.replace("-", ".")
 
-    with open(filename, "r") as f:
-        content = f.read()
-        if not content:
-            data = {}
-        else:
-            data = json.loads(content)
+    data = load_json_file(filename)
 
     # Clear or create the Markdown file
     with open(md_filename, "w+") as f:
@@ -659,6 +818,7 @@ def demo(**config):
     """
     data_collector = []
     data_collector_web = []
+    repo_url_cache.update(load_json_file(REPO_URL_CACHE_FILE))
 
     keywords = config["kv"]
     max_results = config["max_results"]
@@ -668,11 +828,16 @@ def demo(**config):
     b_update = config["update_paper_links"]
     logging.info(f"Update Paper Link = {b_update}")
     if not config["update_paper_links"]:
+        # Papers already listed with a code link need no lookup or download
+        corpus = load_json_file(config["paper_list_json_path"])
         logging.info("GET daily papers begin")
         for topic, keyword in keywords.items():
             logging.info(f"Keyword: {topic}")
             data, data_web = get_daily_papers(
-                topic, query=keyword, max_results=max_results
+                topic,
+                query=keyword,
+                max_results=max_results,
+                existing=corpus.get(topic),
             )
             data_collector.append(data)
             data_collector_web.append(data_web)
@@ -690,6 +855,9 @@ def demo(**config):
             json_file, md_file, task="Update Readme", show_badge=show_badge
         )
 
+    os.makedirs(os.path.dirname(REPO_URL_CACHE_FILE), exist_ok=True)
+    save_json_file(REPO_URL_CACHE_FILE, repo_url_cache)
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -0,0 +1,133 @@
+import datetime
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from autoscholar.crawler.arxiv_crawler import (
+    ARXIV_DELAY_SECONDS,
+    ArxivCrawler,
+    _strip_version,
+)
+
+
+class TestArxivCrawler(unittest.TestCase):
+    """Test ArxivCrawler helpers that need no network access."""
+
+    def setUp(self):
+        """Create a crawler writing to a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.crawler = ArxivCrawler(output_dir=self.temp_dir.name)
+        self.crawler._session = MagicMock()
+        self.result = MagicMock()
+        self.result.published = datetime.datetime(2024, 1, 1)
+        self.result.pdf_url = "http://arxiv.org/pdf/2401.00001v1"
+
+    def test_download_pdf_skips_converted_paper(self):
+        """Test that existing Markdown skips the download without a PDF."""
+        folder = self.crawler._get_pdf_folder(
+            "topic", datetime.date(2024, 1, 1)
+        )
+        (folder / "2401.00001.md").write_text("# Paper")
+
+        pdf_path = self.crawler._download_pdf(
+            self.result, "2401.00001", "topic"
+        )
+
+        self.assertIsNone(pdf_path)
+        self.crawler._session.get.assert_not_called()
+
+    def test_download_pdf_logs_write_errors(self):
+        """Test that an error writing the PDF only skips the paper."""
+        response = self.crawler._session.get.return_value.__enter__.return_value
+        response.iter_content.side_effect = OSError("disk full")
+
+        with self.assertLogs("autoscholar.crawler.arxiv_crawler", "ERROR"):
+            pdf_path = self.crawler._download_pdf(
+                self.result, "2401.00001", "topic"
+            )
+
+        self.assertIsNone(pdf_path)
+
+    def test_download_pdf_retries_interrupted_download(self):
+        """Test that a failed download leaves no PDF and is retried."""
+        response = self.crawler._session.get.return_value.__enter__.return_value
+
+        def interrupted(chunk_size):
+            yield b"%PDF-1.5 partial"
+            raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+        response.iter_content.side_effect = interrupted
+        folder = self.crawler._get_pdf_folder(
+            "topic", datetime.date(2024, 1, 1)
+        )
+
+        with self.assertLogs("autoscholar.crawler.arxiv_crawler", "ERROR"):
+            pdf_path = self.crawler._download_pdf(
+                self.result, "2401.00001", "topic"
+            )
+
+        self.assertIsNone(pdf_path)
+        self.assertEqual(list(folder.iterdir()), [])
+
+        response.iter_content.side_effect = lambda chunk_size: iter(
+            [b"%PDF-1.5 complete"]
+        )
+        pdf_path = self.crawler._download_pdf(
+            self.result, "2401.00001", "topic"
+        )
+
+        self.assertEqual(self.crawler._session.get.call_count, 2)
+        self.assertEqual(pdf_path.read_bytes(), b"%PDF-1.5 complete")
+
+    def test_strip_version(self):
+        """Test that only a trailing version number is removed."""
+        self.assertEqual(_strip_version("2401.00001v2"), "2401.00001")
+        self.assertEqual(_strip_version("2401.00001"), "2401.00001")
+        self.assertEqual(
+            _strip_version("solv-int/9901001v1"), "solv-int/9901001"
+        )
+        self.assertEqual(_strip_version("solv-int/9901001"), "solv-int/9901001")
+
+    def test_fetch_papers_deduplicates_by_id(self):
+        """Test that papers are deduplicated by ID rather than by title."""
+        results = []
+        for paper_id in ("2401.00001v1", "2401.00001v2", "2401.00002v1"):
+            result = MagicMock(title="Same Title")
+            result.get_short_id.return_value = paper_id
+            results.append(result)
+        self.crawler._search = MagicMock(return_value=results)
+        self.crawler._get_code_url = MagicMock(return_value=None)
+        self.crawler._process_paper = MagicMock(return_value={})
+        self.crawler._writer = MagicMock()
+        self.crawler._paper_executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(self.crawler._paper_executor.shutdown)
+
+        self.crawler._fetch_papers("topic", "query", 10)
+
+        written = [
+            call.args[0] for call in self.crawler._writer.write.call_args_list
+        ]
+        self.assertEqual(written, ["2401.00001", "2401.00002"])
+
+    def test_searches_are_spaced_out(self):
+        """Test that a search waits for the arXiv delay after the last one."""
+        client = MagicMock()
+        client.results.return_value = iter([])
+        self.crawler._get_arxiv_client = MagicMock(return_value=client)
+
+        with patch("autoscholar.crawler.arxiv_crawler.time.sleep") as sleep:
+            self.crawler._search("first query", 10)
+            sleep.assert_not_called()
+            self.crawler._search("second query", 10)
+
+        sleep.assert_called_once()
+        self.assertGreater(sleep.call_args.args[0], 0)
+        self.assertLessEqual(sleep.call_args.args[0], ARXIV_DELAY_SECONDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from autoscholar.crawler import base_crawler
+from autoscholar.crawler.base_crawler import BaseCrawler
+
+
+class DummyCrawler(BaseCrawler):
+    """Crawler that only records its configuration."""
+
+    def run(self, **kwargs):
+        """Do nothing."""
+
+
+class TestBaseCrawler(unittest.TestCase):
+    """Test creating crawlers from configuration."""
+
+    def setUp(self):
+        """Create a temporary configuration file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.output_dir = os.path.join(self.temp_dir.name, "data")
+        self.config_path = Path(self.temp_dir.name) / "config.yaml"
+        self.config_path.write_text(
+            f"output_dir: {self.output_dir}\nkeywords:\n  a: 1\n"
+        )
+
+    def test_from_config_file_caches_parsed_file(self):
+        """Test that an unchanged file is parsed once."""
+        with patch.object(
+            base_crawler.yaml, "load", wraps=base_crawler.yaml.load
+        ) as load:
+            first = DummyCrawler.from_config_file(self.config_path, extra=1)
+            second = DummyCrawler.from_config_file(str(self.config_path))
+
+        load.assert_called_once()
+        self.assertEqual(first.config["extra"], 1)
+        self.assertNotIn("extra", second.config)
+        self.assertEqual(second.output_dir, self.output_dir)
+
+    def test_from_config_file_reloads_modified_file(self):
+        """Test that a modified file is parsed again."""
+        DummyCrawler.from_config_file(self.config_path)
+        self.config_path.write_text(
+            f"output_dir: {self.output_dir}\nmax_results: 5\n"
+        )
+        os.utime(self.config_path, ns=(0, 0))
+
+        crawler = DummyCrawler.from_config_file(self.config_path)
+
+        self.assertEqual(crawler.config["max_results"], 5)
+
+    def test_from_config_dict_does_not_modify_input(self):
+        """Test that overrides are not written back to the input dict."""
+        config = {"output_dir": self.output_dir, "keywords": {"a": 1}}
+
+        crawler = DummyCrawler.from_config_dict(config, max_results=3)
+        crawler.config["keywords"]["b"] = 2
+
+        self.assertEqual(
+            config, {"output_dir": self.output_dir, "keywords": {"a": 1}}
+        )
+        self.assertEqual(crawler.config["max_results"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
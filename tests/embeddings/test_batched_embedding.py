@@ -0,0 +1,100 @@
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from camel.embeddings import BaseEmbedding
+
+from autoscholar.embeddings import BatchedEmbedding, EmbeddingCache
+
+
+class FakeEmbedding(BaseEmbedding[str]):
+    """Embedding model that records the size of every request."""
+
+    def __init__(self, delay=0.0):
+        self.requests = []
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def embed_list(self, objs, **kwargs):
+        with self._lock:
+            self.requests.append(len(objs))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return [[float(len(obj)), 1.0] for obj in objs]
+
+    def get_output_dim(self):
+        return 2
+
+
+class TestBatchedEmbedding(unittest.TestCase):
+    """Test the BatchedEmbedding class."""
+
+    def test_inputs_are_chunked(self):
+        """Test that inputs are sent in chunks and returned in order."""
+        model = FakeEmbedding()
+        embedding = BatchedEmbedding(model, batch_size=3)
+        texts = ["a" * i for i in range(7)]
+
+        result = embedding.embed_list(texts)
+
+        self.assertEqual(sorted(model.requests), [1, 3, 3])
+        self.assertEqual([vec[0] for vec in result], list(range(7)))
+        self.assertEqual(embedding.get_output_dim(), 2)
+
+    def test_chunks_are_sent_concurrently(self):
+        """Test that chunk requests overlap up to max_workers."""
+        model = FakeEmbedding(delay=0.05)
+        embedding = BatchedEmbedding(model, batch_size=1, max_workers=2)
+        texts = ["a" * i for i in range(6)]
+
+        result = embedding.embed_list(texts)
+
+        self.assertEqual(model.max_active, 2)
+        self.assertEqual([vec[0] for vec in result], list(range(6)))
+
+    def test_cache_skips_known_texts(self):
+        """Test that only texts missing from the cache reach the model."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = EmbeddingCache(Path(tmpdir) / "embeddings.sqlite")
+            model = FakeEmbedding()
+            embedding = BatchedEmbedding(model, cache=cache)
+
+            first = embedding.embed_list(["a", "bb"])
+            second = embedding.embed_list(["bb", "ccc", "a"])
+            cache.close()
+
+        self.assertEqual(model.requests, [2, 1])
+        self.assertEqual(first, [[1.0, 1.0], [2.0, 1.0]])
+        self.assertEqual(second, [[2.0, 1.0], [3.0, 1.0], [1.0, 1.0]])
+
+    def test_duplicates_are_embedded_once(self):
+        """Test that duplicate texts are sent once and scattered back."""
+        model = FakeEmbedding()
+        embedding = BatchedEmbedding(model)
+
+        result = embedding.embed_list(["a", "bb", "a", "ccc", "bb"])
+
+        self.assertEqual(model.requests, [3])
+        self.assertEqual([vec[0] for vec in result], [1, 2, 1, 3, 2])
+
+    def test_empty_input(self):
+        """Test that an empty list makes no request."""
+        model = FakeEmbedding()
+        self.assertEqual(BatchedEmbedding(model).embed_list([]), [])
+        self.assertEqual(model.requests, [])
+
+    def test_invalid_batch_size(self):
+        """Test that a non-positive batch size is rejected."""
+        with self.assertRaises(ValueError):
+            BatchedEmbedding(FakeEmbedding(), batch_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from autoscholar.embeddings import EmbeddingCache
+
+
+class TestEmbeddingCache(unittest.TestCase):
+    """Test the EmbeddingCache class."""
+
+    def setUp(self):
+        """Create a cache in a temporary directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "embeddings.sqlite"
+        self.cache = EmbeddingCache(self.path)
+
+    def tearDown(self):
+        """Close the cache and remove the temporary directory."""
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def test_put_and_get(self):
+        """Test that vectors round-trip as float32 and persist on disk."""
+        key = EmbeddingCache.make_key("model:2", "text")
+        self.assertIsNone(self.cache.get(key))
+
+        self.cache.put(key, [0.5, 1.5])
+        self.cache.close()
+        self.cache = EmbeddingCache(self.path)
+
+        vector = self.cache.get(key)
+        self.assertEqual(vector.dtype, np.float32)
+        np.testing.assert_array_equal(vector, [0.5, 1.5])
+
+    def test_keys_depend_on_model(self):
+        """Test that the same text gets different keys for other models."""
+        self.assertNotEqual(
+            EmbeddingCache.make_key("model-a:2", "text"),
+            EmbeddingCache.make_key("model-b:2", "text"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from camel.types import EmbeddingModelType
+
+from autoscholar.embeddings import OpenAIBatchEmbedding
+
+
+class FakeClient:
+    """OpenAI client that completes batch jobs immediately."""
+
+    def __init__(self, status="completed", output=True):
+        self.requests = []
+        self.jobs = []
+        self.status = status
+        self.output = output
+        self.files = SimpleNamespace(
+            create=self._create_file, content=self._file_content
+        )
+        self.batches = SimpleNamespace(
+            create=self._create_batch, retrieve=self._retrieve_batch
+        )
+
+    def _create_file(self, file, purpose):
+        requests = [json.loads(line) for line in file[1].splitlines()]
+        self.requests.extend(requests)
+        self.jobs.append(requests)
+        return SimpleNamespace(id=f"in-{len(self.jobs) - 1}")
+
+    def _create_batch(self, input_file_id, endpoint, completion_window):
+        return SimpleNamespace(id=input_file_id.replace("in", "batch"))
+
+    def _retrieve_batch(self, batch_id):
+        job = batch_id.replace("batch", "")
+        return SimpleNamespace(
+            status=self.status,
+            output_file_id=f"out{job}" if self.output else None,
+            error_file_id=None if self.output else f"err{job}",
+        )
+
+    def _file_content(self, file_id):
+        if file_id.startswith("err"):
+            return SimpleNamespace(content=b'{"error": "invalid model"}')
+        # Return the results in reverse order, as the API does not keep it
+        lines = []
+        for request in reversed(self.jobs[int(file_id.split("-")[1])]):
+            data = [
+                {"index": i, "embedding": [float(len(text))]}
+                for i, text in enumerate(request["body"]["input"])
+            ]
+            result = {
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "body": {"data": data}},
+            }
+            lines.append(json.dumps(result))
+        return SimpleNamespace(content="\n".join(lines).encode())
+
+
+def make_model(client):
+    """Create a stand-in for camel's OpenAIEmbedding."""
+    model_type = EmbeddingModelType.TEXT_EMBEDDING_3_SMALL
+    return SimpleNamespace(
+        model_type=model_type,
+        output_dim=model_type.output_dim,
+        client=client,
+        embed_list=lambda objs, **kwargs: [[-1.0] for _ in objs],
+    )
+
+
+class TestOpenAIBatchEmbedding(unittest.TestCase):
+    """Test the OpenAIBatchEmbedding class."""
+
+    def test_small_lists_use_synchronous_endpoint(self):
+        """Test that lists below the threshold skip the Batch API."""
+        client = FakeClient()
+        embedding = OpenAIBatchEmbedding(make_model(client))
+
+        self.assertEqual(embedding.embed_list(["a", "b"]), [[-1.0], [-1.0]])
+        self.assertEqual(client.requests, [])
+
+    def test_batch_results_are_in_input_order(self):
+        """Test that batch output is reassembled in input order."""
+        client = FakeClient()
+        embedding = OpenAIBatchEmbedding(make_model(client), min_batch_inputs=1)
+        texts = ["a" * (i % 7 + 1) for i in range(5000)]
+
+        result = embedding.embed_list(texts)
+
+        self.assertEqual(len(client.requests), 3)
+        self.assertNotIn("dimensions", client.requests[0]["body"])
+        self.assertEqual(result, [[float(len(text))] for text in texts])
+
+    def test_failed_batch_raises(self):
+        """Test that a failed batch job raises an error."""
+        embedding = OpenAIBatchEmbedding(
+            make_model(FakeClient(status="failed")), min_batch_inputs=1
+        )
+        with self.assertRaises(RuntimeError):
+            embedding.embed_list(["a"])
+
+    def test_large_lists_are_split_into_jobs(self):
+        """Test that inputs beyond the per-job limit go to several jobs."""
+        client = FakeClient()
+        embedding = OpenAIBatchEmbedding(make_model(client), min_batch_inputs=1)
+        texts = ["a" * (i % 7 + 1) for i in range(5000)]
+
+        with patch(
+            "autoscholar.embeddings.openai_batch.MAX_BATCH_INPUTS", 2000
+        ):
+            result = embedding.embed_list(texts)
+
+        self.assertEqual([len(job) for job in client.jobs], [1, 1, 1])
+        self.assertEqual(result, [[float(len(text))] for text in texts])
+
+    def test_batch_without_output_reports_errors(self):
+        """Test that a batch whose requests all failed shows its errors."""
+        embedding = OpenAIBatchEmbedding(
+            make_model(FakeClient(output=False)), min_batch_inputs=1
+        )
+        with self.assertRaisesRegex(RuntimeError, "invalid model"):
+            embedding.embed_list(["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
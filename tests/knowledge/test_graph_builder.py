@@ -0,0 +1,58 @@
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from autoscholar.knowledge import graph_builder
+from autoscholar.knowledge.graph_builder import KnowledgeGraphBuilder
+from autoscholar.knowledge.paper import Paper
+
+
+class TestKnowledgeGraphBuilder(unittest.TestCase):
+    """Test KnowledgeGraphBuilder."""
+
+    def test_no_model_does_not_import_camel(self):
+        """Test that a builder without a model leaves camel unimported."""
+        code = (
+            "import sys\n"
+            "from autoscholar.knowledge import KnowledgeGraphBuilder\n"
+            "KnowledgeGraphBuilder()\n"
+            "print('camel' in sys.modules)\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        self.assertEqual(output.strip(), "False")
+
+    def test_similarity_matrix_is_cached(self):
+        """Test that the matrix is computed once per set of embeddings."""
+        papers = [Paper(title=f"Paper {i}", paper_id=str(i)) for i in range(3)]
+        embeddings = {"0": [1.0, 0.0], "1": [1.0, 1.0], "2": [0.0, 1.0]}
+        builder = KnowledgeGraphBuilder()
+        builder.build_graph(papers, embeddings)
+
+        with patch.object(
+            graph_builder,
+            "compute_similarity_matrix",
+            wraps=graph_builder.compute_similarity_matrix,
+        ) as compute:
+            first = builder.similarity_matrix
+            second = builder.similarity_matrix
+            builder.build_graph(papers[:2], embeddings)
+            third = builder.similarity_matrix
+
+        self.assertIs(first, second)
+        self.assertEqual(third.shape, (2, 2))
+        self.assertEqual(compute.call_count, 2)
+
+        builder.similarity_matrix = np.eye(2)
+        np.testing.assert_array_equal(builder.similarity_matrix, np.eye(2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 
 import networkx as nx
+import numpy as np
+from scipy import sparse
 
 from autoscholar.knowledge.knowledge_graph import KnowledgeGraph
 from autoscholar.knowledge.paper import Paper
@@ -50,6 +52,29 @@ class TestKnowledgeGraph(unittest.TestCase):
             kg.graph[self.paper1.paper_id][self.paper2.paper_id]["weight"], 0.8
         )
 
+    def test_knowledge_graph_from_adjacency(self):
+        """Test a knowledge graph backed by a CSR adjacency matrix."""
+        papers = self.papers + [
+            Paper(title="Test paper 3", abstract="", paper_id="paper3")
+        ]
+        adjacency = sparse.csr_array(
+            np.array([[0.0, 0.8, 0.0], [0.8, 0.0, 0.6], [0.0, 0.6, 0.0]])
+        )
+        kg = KnowledgeGraph(papers=papers, adjacency=adjacency)
+
+        np.testing.assert_array_equal(kg.shortest_path(0), [0.0, 1.0, 2.0])
+        self.assertEqual(len(kg.graph.edges), 2)
+        self.assertEqual(kg.graph[1][2]["weight"], 0.6)
+        self.assertEqual(kg.graph.nodes[2]["paper_id"], "paper3")
+
+    def test_adjacency_from_graph(self):
+        """Test that a networkx-backed graph exposes its adjacency."""
+        kg = KnowledgeGraph(graph=self.graph, papers=self.papers)
+
+        np.testing.assert_array_equal(
+            kg.adjacency.toarray(), [[0.0, 0.8], [0.8, 0.0]]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,9 @@
+import json
+import tempfile
 import unittest
+from pathlib import Path
+
+import numpy as np
 
 from autoscholar.knowledge.paper import Paper
 
@@ -63,7 +68,8 @@ class TestPaper(unittest.TestCase):
 
         embedding = [0.1, 0.2, 0.3]
         paper.set_embedding(embedding)
-        self.assertEqual(paper.embedding, embedding)
+        self.assertEqual(paper.embedding.dtype, np.float32)
+        np.testing.assert_allclose(paper.embedding, embedding, rtol=1e-6)
 
     def test_json_operations(self):
         """Test the JSON related operations."""
@@ -110,3 +116,46 @@ class TestPaper(unittest.TestCase):
         self.assertEqual(
             paper.get_text_for_embedding(custom_text_fn), expected_text
         )
+
+    def test_text_for_embedding_is_truncated(self):
+        """Test that long embedding texts are trimmed to the token budget."""
+        paper = Paper(title=self.test_title, full_text="word " * 1000)
+
+        def full_text_fn(paper):
+            return paper.full_text
+
+        text = paper.get_text_for_embedding(full_text_fn, max_tokens=100)
+        self.assertLess(len(text), len(paper.full_text))
+        self.assertTrue(paper.full_text.startswith(text))
+
+        text = paper.get_text_for_embedding(full_text_fn, max_tokens=None)
+        self.assertEqual(text, paper.full_text)
+
+    def test_load_paper_from_paths(self):
+        """Test loading papers from files, keeping the order of the paths."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = []
+            for i in range(5):
+                path = Path(tmpdir) / f"paper{i}.json"
+                path.write_text(json.dumps({"title": f"Paper {i}"}))
+                paths.append(path)
+
+            papers = Paper.load_paper_from_paths(paths)
+
+        self.assertEqual(
+            [paper.title for paper in papers], [f"Paper {i}" for i in range(5)]
+        )
+
+    def test_text_for_embedding_follows_updates(self):
+        """Test that the cached embedding text tracks title changes."""
+        paper = Paper(title=self.test_title, abstract=self.test_abstract)
+        self.assertEqual(
+            paper.get_text_for_embedding(),
+            f"{self.test_title}\n\n{self.test_abstract}",
+        )
+
+        paper.title = "New title"
+        self.assertEqual(
+            paper.get_text_for_embedding(),
+            f"New title\n\n{self.test_abstract}",
+        )
@@ -1,13 +1,17 @@
 import json
 import os
+import sys
 import tempfile
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from autoscholar.knowledge.paper import Paper
 from autoscholar.parser.pdf_parser import (
     MarkdownConverter,
+    MarkerLibraryConverter,
     MarkerSingleConverter,
     PDF2MarkdownTool,
 )
@@ -80,6 +84,85 @@ class TestMarkerSingleConverter(unittest.TestCase):
         with self.assertRaises(Exception):
             converter.convert(Path("test.pdf"))
 
+    @patch("subprocess.run")
+    @patch("pathlib.Path.exists")
+    def test_convert_failure_reports_stderr(self, mock_exists, mock_run):
+        """Test that the end of marker's stderr is reported on failure."""
+        mock_exists.return_value = True
+
+        def run(cmd, stdout, stderr):
+            stderr.write(b"progress\nError: out of memory")
+            return MagicMock(returncode=1)
+
+        mock_run.side_effect = run
+
+        converter = MarkerSingleConverter()
+        with self.assertRaisesRegex(Exception, "out of memory"):
+            converter.convert(Path("test.pdf"))
+
+
+class TestMarkerLibraryConverter(unittest.TestCase):
+    """Test MarkerLibraryConverter class."""
+
+    def setUp(self):
+        """Replace marker's modules with mocks."""
+        self.pdf_module = MagicMock()
+        self.models_module = MagicMock()
+        self.output_module = MagicMock()
+        self.output_module.text_from_rendered.return_value = (
+            "# Title",
+            "md",
+            {},
+        )
+        modules = patch.dict(
+            sys.modules,
+            {
+                "marker": MagicMock(),
+                "marker.converters": MagicMock(),
+                "marker.converters.pdf": self.pdf_module,
+                "marker.models": self.models_module,
+                "marker.output": self.output_module,
+            },
+        )
+        modules.start()
+        self.addCleanup(modules.stop)
+
+    @patch("pathlib.Path.exists", return_value=True)
+    def test_models_loaded_once(self, mock_exists):
+        """Test that several conversions reuse the loaded models."""
+        converter = MarkerLibraryConverter()
+
+        self.assertEqual(converter.convert(Path("a.pdf")), "# Title")
+        self.assertEqual(converter.convert(Path("b.pdf")), "# Title")
+
+        self.models_module.create_model_dict.assert_called_once()
+        self.pdf_module.PdfConverter.assert_called_once()
+        pdf_converter = self.pdf_module.PdfConverter.return_value
+        self.assertEqual(pdf_converter.call_count, 2)
+
+    @patch("pathlib.Path.exists", return_value=True)
+    def test_conversions_are_serialized(self, mock_exists):
+        """Test that threads never call marker's converter concurrently."""
+        active = []
+        overlaps = []
+
+        def convert(path):
+            active.append(path)
+            overlaps.append(len(active) > 1)
+            time.sleep(0.01)
+            active.remove(path)
+            return MagicMock()
+
+        self.pdf_module.PdfConverter.return_value.side_effect = convert
+        converter = MarkerLibraryConverter()
+        paths = [Path(f"paper{i}.pdf") for i in range(4)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(converter.convert, paths))
+
+        self.assertEqual(len(overlaps), 4)
+        self.assertFalse(any(overlaps))
+
 
 class TestPDF2MarkdownTool(unittest.TestCase):
     """Test PDF2MarkdownTool class."""
@@ -105,6 +188,39 @@ class TestPDF2MarkdownTool(unittest.TestCase):
         self.assertIn("Test Title", result)
         self.assertIn("Test Section", result)
 
+    def test_parse_many(self):
+        """Test that several PDFs are parsed in the order given."""
+        converter = MagicMock()
+        converter.convert.side_effect = lambda pdf_path, **options: (
+            f"# {pdf_path.stem}"
+        )
+        pdf_tool = PDF2MarkdownTool(converter=converter, num_workers=2)
+
+        result = pdf_tool.parse_many([f"paper{i}.pdf" for i in range(5)])
+
+        self.assertEqual(result, [f"# paper{i}" for i in range(5)])
+
+    def test_parse_uses_cache(self):
+        """Test that unchanged PDFs are converted only once."""
+        converter = MagicMock(wraps=self.mock_converter)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            pdf_tool = PDF2MarkdownTool(
+                converter=converter, cache_dir=cache_dir
+            )
+            pdf_path = Path(self.temp_dir) / "paper.pdf"
+            pdf_path.write_bytes(b"%PDF-1.4 first")
+
+            first = pdf_tool.parse(pdf_path)
+            second = pdf_tool.parse(pdf_path)
+            self.assertEqual(first, second)
+            self.assertEqual(converter.convert.call_count, 1)
+
+            # Changing the PDF or the options converts it again
+            pdf_path.write_bytes(b"%PDF-1.4 second")
+            pdf_tool.parse(pdf_path)
+            pdf_tool.parse(pdf_path, page_range="0-1")
+            self.assertEqual(converter.convert.call_count, 3)
+
     def test_get_format(self):
         """Test get_format method."""
         from autoscholar.parser.parse_tool import STRUCTURED_TYPES
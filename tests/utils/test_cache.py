@@ -0,0 +1,72 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from autoscholar.utils.cache import JsonCache
+
+
+class TestJsonCache(unittest.TestCase):
+    """Test the JsonCache class."""
+
+    def setUp(self):
+        """Set up a temporary cache file path."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.temp_dir.name) / "cache.json"
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_set_and_get(self):
+        """Test storing and retrieving values, including None."""
+        cache = JsonCache(self.cache_path)
+        cache.set("a", "value")
+        cache.set("b", None)
+
+        self.assertIn("a", cache)
+        self.assertIn("b", cache)
+        self.assertNotIn("c", cache)
+        self.assertEqual(cache.get("a"), "value")
+        self.assertIsNone(cache.get("b", "default"))
+        self.assertEqual(cache.get("c", "default"), "default")
+
+    def test_persistence(self):
+        """Test that saved entries are reloaded from disk."""
+        cache = JsonCache(self.cache_path)
+        cache.set("a", {"url": "http://example.com"})
+        cache.save()
+
+        reloaded = JsonCache(self.cache_path)
+        self.assertEqual(reloaded.get("a"), {"url": "http://example.com"})
+
+    def test_ttl_expiry(self):
+        """Test that entries older than the TTL are treated as missing."""
+        cache = JsonCache(self.cache_path, ttl=60)
+        cache.set("a", "value")
+        cache._data["a"][1] = time.time() - 120
+
+        self.assertNotIn("a", cache)
+        self.assertIsNone(cache.get("a"))
+
+    def test_save_drops_stale_entries(self):
+        """Test that expired entries are not written back to disk."""
+        cache = JsonCache(self.cache_path, ttl=60)
+        cache.set("old", "value")
+        cache._data["old"][1] = time.time() - 120
+        cache.set("new", "value")
+        cache.save()
+
+        reloaded = JsonCache(self.cache_path, ttl=60)
+        self.assertEqual(len(reloaded), 1)
+        self.assertIn("new", reloaded)
+
+    def test_corrupt_file_is_ignored(self):
+        """Test that an unreadable cache file starts an empty cache."""
+        self.cache_path.write_text("{not json")
+        cache = JsonCache(self.cache_path)
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from autoscholar.utils import fast_json
+
+
+class TestFastJson(unittest.TestCase):
+    """Test the orjson-backed JSON helpers and their fallback."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.data = {"title": "Résumé", "authors": ["A", "B"], "year": 2025}
+
+    def test_round_trip(self):
+        """Test that dumped data is parsed back unchanged."""
+        for indent in (False, True):
+            encoded = fast_json.dumps(self.data, indent=indent)
+            self.assertIsInstance(encoded, bytes)
+            self.assertEqual(fast_json.loads(encoded), self.data)
+
+    def test_stdlib_fallback(self):
+        """Test that the helpers work without orjson installed."""
+        with patch.object(fast_json, "orjson", None):
+            encoded = fast_json.dumps(self.data, indent=True)
+            self.assertEqual(json.loads(encoded), self.data)
+            self.assertEqual(fast_json.loads(encoded), self.data)
+
+    def test_invalid_json_raises_decode_error(self):
+        """Test that invalid input raises json.JSONDecodeError."""
+        with self.assertRaises(json.JSONDecodeError):
+            fast_json.loads(b"{not json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from autoscholar.utils.jsonl import (
+    JsonlWriter,
+    append_records,
+    load_records,
+)
+
+
+class TestJsonl(unittest.TestCase):
+    """Test the JSON Lines record helpers."""
+
+    def setUp(self):
+        """Set up a temporary records file path."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "records.jsonl"
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_append_and_load(self):
+        """Test that appended records are loaded back by key."""
+        append_records(self.path, {"a": {"title": "A"}, "b": {"title": "B"}})
+        append_records(self.path, {"c": {"title": "C"}})
+
+        records = load_records(self.path)
+        self.assertEqual(list(records), ["a", "b", "c"])
+        self.assertEqual(records["c"], {"title": "C"})
+
+    def test_last_record_wins(self):
+        """Test that a later record replaces an earlier one with the same key."""
+        append_records(self.path, {"a": {"title": "old"}})
+        append_records(self.path, {"a": {"title": "new"}})
+
+        self.assertEqual(load_records(self.path), {"a": {"title": "new"}})
+
+    def test_writer_flushes_each_record(self):
+        """Test that JsonlWriter records are readable before it is closed."""
+        with JsonlWriter(self.path) as writer:
+            writer.write("a", {"title": "A"})
+            self.assertEqual(load_records(self.path), {"a": {"title": "A"}})
+            writer.write("b", {"title": "B"})
+            self.assertEqual(writer.count, 2)
+
+        append_records(self.path, {"c": {"title": "C"}})
+        self.assertEqual(list(load_records(self.path)), ["a", "b", "c"])
+
+    def test_gzip_append_and_load(self):
+        """Test that ".gz" files are compressed and can be appended to."""
+        path = self.path.with_name("records.jsonl.gz")
+        append_records(path, {"a": {"title": "A"}})
+        with JsonlWriter(path) as writer:
+            writer.write("b", {"title": "B"})
+
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(2), b"\x1f\x8b")
+        self.assertEqual(
+            load_records(path), {"a": {"title": "A"}, "b": {"title": "B"}}
+        )
+
+    def test_unused_writer_creates_no_file(self):
+        """Test that a writer without records does not create the file."""
+        JsonlWriter(self.path).close()
+        self.assertFalse(self.path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+import logging
+import unittest
+
+from autoscholar.utils.logger import setup_logger
+
+
+class TestSetupLogger(unittest.TestCase):
+    """Test the setup_logger helper."""
+
+    def test_repeated_calls_add_one_handler(self):
+        """Test that setting up a logger twice keeps a single handler."""
+        name = "autoscholar.tests.logger"
+        self.addCleanup(logging.getLogger(name).handlers.clear)
+
+        first = setup_logger(name)
+        second = setup_logger(name, level=logging.DEBUG)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(second.handlers), 1)
+        self.assertEqual(second.level, logging.DEBUG)
+        self.assertTrue(second.propagate)
+
+
+if __name__ == "__main__":
+    unittest.main()
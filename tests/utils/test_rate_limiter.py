@@ -0,0 +1,50 @@
+import threading
+import time
+import unittest
+
+from autoscholar.utils.rate_limiter import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test the RateLimiter class."""
+
+    def test_calls_within_limit_do_not_block(self):
+        """Test that calls up to the limit are allowed immediately."""
+        limiter = RateLimiter(calls=3, period=10.0)
+        start = time.monotonic()
+        for _ in range(3):
+            with limiter:
+                pass
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_calls_over_limit_wait_for_window(self):
+        """Test that extra calls wait until the window frees up."""
+        limiter = RateLimiter(calls=2, period=0.2)
+        timestamps = []
+        lock = threading.Lock()
+
+        def worker():
+            with limiter:
+                with lock:
+                    timestamps.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        timestamps.sort()
+        self.assertGreaterEqual(timestamps[2] - start, 0.19)
+
+    def test_invalid_arguments(self):
+        """Test that invalid limits are rejected."""
+        with self.assertRaises(ValueError):
+            RateLimiter(calls=0, period=1.0)
+        with self.assertRaises(ValueError):
+            RateLimiter(calls=1, period=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
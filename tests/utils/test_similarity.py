@@ -0,0 +1,165 @@
+import unittest
+
+import numpy as np
+from sklearn.metrics.pairwise import cosine_similarity
+
+from autoscholar.utils.similarity import (
+    PaperIndex,
+    compute_condensed_similarity,
+    compute_similarity_matrix,
+    dequantize_embeddings,
+    filter_connections_by_threshold,
+    find_similar_pairs,
+    get_similar_papers,
+    quantize_embeddings,
+    streaming_filter_connections,
+)
+
+
+class TestSimilarity(unittest.TestCase):
+    """Test the similarity helpers."""
+
+    def setUp(self):
+        """Set up a small set of embeddings."""
+        self.embeddings = [
+            [1.0, 0.0, 0.0],
+            [1.0, 1.0, 0.0],
+            [0.0, 0.0, 2.0],
+            [0.0, 0.0, 0.0],
+        ]
+
+    def test_compute_similarity_matrix(self):
+        """Test cosine similarities against a direct computation."""
+        matrix = compute_similarity_matrix(self.embeddings)
+
+        self.assertEqual(matrix.shape, (4, 4))
+        self.assertAlmostEqual(matrix[0, 0], 1.0)
+        self.assertAlmostEqual(matrix[0, 1], 1 / np.sqrt(2))
+        self.assertAlmostEqual(matrix[0, 2], 0.0)
+        # Zero vectors are not similar to anything
+        np.testing.assert_array_equal(matrix[3], np.zeros(4))
+        np.testing.assert_array_equal(np.diag(matrix), [1.0, 1.0, 1.0, 0.0])
+
+    def test_compute_similarity_matrix_keeps_dtype(self):
+        """Test that float32 input produces a float32 matrix."""
+        embeddings = np.asarray(self.embeddings, dtype=np.float32)
+        matrix = compute_similarity_matrix(embeddings)
+        self.assertEqual(matrix.dtype, np.float32)
+        np.testing.assert_allclose(
+            matrix, compute_similarity_matrix(self.embeddings), atol=1e-6
+        )
+
+    def test_compute_condensed_similarity(self):
+        """Test that the condensed form matches the full upper triangle."""
+        rng = np.random.default_rng(0)
+        embeddings = rng.standard_normal((10, 4))
+        rows, cols = np.triu_indices(10, k=1)
+        expected = compute_similarity_matrix(embeddings, dtype=None)[rows, cols]
+
+        for block_size in (1, 3, 1024):
+            condensed = compute_condensed_similarity(embeddings, block_size)
+            np.testing.assert_allclose(condensed, expected)
+
+    def test_find_similar_pairs(self):
+        """Test that pairs above the threshold match the full matrix."""
+        rng = np.random.default_rng(0)
+        embeddings = rng.standard_normal((50, 4)).astype(np.float32)
+        matrix = compute_similarity_matrix(embeddings)
+        expected_rows, expected_cols = np.nonzero(np.triu(matrix >= 0.3, k=1))
+
+        for block_size in (7, 1024, None):
+            rows, cols, sims = find_similar_pairs(embeddings, 0.3, block_size)
+            np.testing.assert_array_equal(rows, expected_rows)
+            np.testing.assert_array_equal(cols, expected_cols)
+            np.testing.assert_allclose(
+                sims, matrix[expected_rows, expected_cols], atol=1e-6
+            )
+
+    def test_quantize_embeddings(self):
+        """Test that int8 quantization round-trips within its resolution."""
+        rng = np.random.default_rng(0)
+        embeddings = rng.standard_normal((20, 16)).astype(np.float32)
+        embeddings[0] = 0.0
+
+        quantized, scales = quantize_embeddings(embeddings)
+        restored = dequantize_embeddings(quantized, scales)
+
+        self.assertEqual(quantized.dtype, np.int8)
+        self.assertEqual(scales.shape, (20, 1))
+        np.testing.assert_array_equal(restored[0], np.zeros(16))
+        self.assertTrue(np.all(np.abs(restored - embeddings) <= scales / 2))
+
+    def test_get_similar_papers(self):
+        """Test top-k retrieval against sklearn's cosine similarity."""
+        rng = np.random.default_rng(0)
+        embeddings = rng.standard_normal((30, 8))
+        query = rng.standard_normal(8)
+        papers = [{"id": i} for i in range(30)]
+        expected = cosine_similarity([query], embeddings)[0]
+
+        results = get_similar_papers(query, embeddings, papers, top_k=5)
+
+        self.assertEqual(
+            [result["paper"]["id"] for result in results],
+            expected.argsort()[-5:][::-1].tolist(),
+        )
+        index = PaperIndex(embeddings, papers)
+        np.testing.assert_allclose(
+            index.similarities(query), expected, atol=1e-6
+        )
+        self.assertEqual(len(index.search(query, top_k=50)), 30)
+        self.assertEqual(index.search(query, top_k=0), [])
+
+    def test_dtype_option(self):
+        """Test that float32 is the default and other dtypes can be chosen."""
+        self.assertEqual(
+            compute_similarity_matrix(self.embeddings).dtype, np.float32
+        )
+        matrix = compute_similarity_matrix(self.embeddings, dtype=np.float64)
+        self.assertEqual(matrix.dtype, np.float64)
+
+        index = PaperIndex(self.embeddings, list(range(4)), dtype=np.float16)
+        self.assertEqual(index.normalized.dtype, np.float16)
+        results = index.search([1.0, 0.9, 0.0], top_k=2)
+        self.assertEqual([result["paper"] for result in results], [1, 0])
+
+    def test_filter_connections_by_threshold(self):
+        """Test that only upper-triangle pairs above the threshold remain."""
+        matrix = compute_similarity_matrix(self.embeddings)
+        connections = filter_connections_by_threshold(matrix, threshold=0.5)
+
+        self.assertEqual(len(connections), 1)
+        i, j, similarity = connections[0]
+        self.assertEqual((i, j), (0, 1))
+        self.assertIsInstance(similarity, float)
+
+    def test_streaming_filter_connections(self):
+        """Test that streamed connections match the full-matrix filter."""
+        rng = np.random.default_rng(0)
+        embeddings = rng.standard_normal((40, 4)).astype(np.float32)
+        expected = filter_connections_by_threshold(
+            compute_similarity_matrix(embeddings), threshold=0.6
+        )
+
+        connections = streaming_filter_connections(
+            embeddings, threshold=0.6, block_size=7
+        )
+
+        self.assertEqual(
+            sorted((i, j) for i, j, _ in connections),
+            sorted((i, j) for i, j, _ in expected),
+        )
+        similarities = [similarity for _, _, similarity in connections]
+        self.assertEqual(similarities, sorted(similarities, reverse=True))
+        np.testing.assert_allclose(
+            similarities,
+            [similarity for _, _, similarity in expected],
+            atol=1e-6,
+        )
+        self.assertEqual(
+            streaming_filter_connections(np.empty((0, 4)), threshold=0.6), []
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()